@@ -10,76 +10,229 @@ Usage:
 
 from __future__ import annotations
 
+import functools
+import importlib.util
+import os
 import re
 import sys
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
 
 import click
 
+# Patterns are compiled once at import; they run for every sentence of every paper
+_SENT_SPLIT = re.compile(r"[.!?]\s+")
+
+# Lowercase needle identifying a DANDI mention; it also covers "48324/dandi"
+# DOIs, so a plain substring test replaces a case-insensitive regex search
+_DANDI_NEEDLE = "dandi"
+
+# Relationship cues, keyed by name (matched against lowercased text)
+_CLASSIFIER_PATTERNS = {
+    "deposited": r"dataset (?:is )?(?:available|deposited|published|released)",
+    "use": r"(?:used|analyzed|examined|studied|processed|downloaded) (?:the )?data",
+    "evaluate": r"evaluat(?:e|ed|ion)",
+    "validate": r"validat(?:e|ed|ion)|benchmark(?:ed|ing)|test(?:ed|ing)",
+    "compiles": r"datasets|combined|aggregated|pooled",
+    "review": r"review|assess(?:ed|ment)|survey",
+    "derived": r"derived|based on|preprocessed|spike.?sorted|transformed",
+    "background": r"available|repository|archive|resource",
+}
+
+# All cues are scanned in a single pass.  Every alternative is a zero-width
+# lookahead so that overlapping cues (e.g. "preprocessed data" is both a
+# derivation and a data-use cue) are all found.
+_CLASSIFIER = re.compile(
+    "|".join(f"(?=(?P<{name}>{pattern}))" for name, pattern in _CLASSIFIER_PATTERNS.items())
+)
+
+
+def _compile_hyperscan_db() -> Any:
+    """Compile the cue patterns into a Hyperscan database, if available.
+
+    Hyperscan scans all patterns simultaneously and reports overlapping
+    matches natively; without it the fused regex above is used.
+    """
+    try:
+        import hyperscan
+    except ImportError:
+        return None
+
+    flags = hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_SINGLEMATCH
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[pattern.encode() for pattern in _CLASSIFIER_PATTERNS.values()],
+        ids=list(range(len(_CLASSIFIER_PATTERNS))),
+        elements=len(_CLASSIFIER_PATTERNS),
+        flags=[flags] * len(_CLASSIFIER_PATTERNS),
+    )
+    return db
+
+
+_HYPERSCAN_DB = _compile_hyperscan_db()
+_HYPERSCAN_GROUPS = tuple(_CLASSIFIER_PATTERNS)
+
+# Named group -> suggested relationship types
+_GROUP_TO_LABELS = {
+    "deposited": ("IsDocumentedBy",),
+    "use": ("Uses/UsesDataFrom",),
+    "evaluate": ("CitesAsEvidence", "Reviews"),
+    "validate": ("CitesAsEvidence",),
+    "compiles": ("Compiles",),
+    "review": ("Reviews",),
+    "derived": ("IsDerivedFrom",),
+    "background": ("References/CitesForInformation",),
+}
+
+# Order in which suggestions are reported
+_LABEL_ORDER = (
+    "IsDocumentedBy",
+    "Uses/UsesDataFrom",
+    "CitesAsEvidence",
+    "Compiles",
+    "Reviews",
+    "IsDerivedFrom",
+    "References/CitesForInformation",
+)
+
+
+def _iter_sentences(text: str) -> Iterator[str]:
+    """Yield sentences of text one at a time (lazy equivalent of re.split)."""
+    pos = 0
+    for match in _SENT_SPLIT.finditer(text):
+        yield text[pos : match.start()]
+        pos = match.end()
+    yield text[pos:]
+
+
+def _iter_pdf_pages(pdf_path: Path) -> Iterator[tuple[int, str]]:
+    """Yield (page_num, text) for each page of a PDF.
+
+    Prefers pypdfium2 (PDFium, C++) and then pypdf, which both extract raw
+    text without building pdfplumber's per-character layout model;
+    pdfplumber is used if neither is installed.
+    """
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        pass
+    else:
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            for page_num, page in enumerate(pdf, 1):
+                textpage = page.get_textpage()
+                yield page_num, textpage.get_text_range()
+                textpage.close()
+                page.close()
+        finally:
+            pdf.close()
+        return
+
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        pass
+    else:
+        reader = PdfReader(pdf_path)
+        for page_num, page in enumerate(reader.pages, 1):
+            yield page_num, page.extract_text() or ""
+        return
+
+    import pdfplumber
+
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_num, page in enumerate(pdf.pages, 1):
+            yield page_num, page.extract_text() or ""
+
 
 def extract_dandi_mentions_pdf(pdf_path: Path) -> list[str]:
     """Extract text snippets mentioning DANDI from PDF.
 
-    Requires: pdfplumber or PyPDF2
+    Requires: pypdfium2, pypdf or pdfplumber
     Returns list of context strings around DANDI mentions.
     """
-    try:
-        import pdfplumber
-    except ImportError:
-        click.echo("Install pdfplumber: pip install pdfplumber", err=True)
+    if not any(importlib.util.find_spec(m) for m in ("pypdfium2", "pypdf", "pdfplumber")):
+        click.echo("Install pypdf: pip install pypdf", err=True)
         return []
 
     mentions = []
-    with pdfplumber.open(pdf_path) as pdf:
-        for page_num, page in enumerate(pdf.pages, 1):
-            text = page.extract_text()
-            if not text:
-                continue
+    for page_num, text in _iter_pdf_pages(pdf_path):
+        if not text or _DANDI_NEEDLE not in text.lower():
+            continue
 
-            # Find sentences containing DANDI
-            sentences = re.split(r"[.!?]\s+", text)
-            for sentence in sentences:
-                if re.search(r"DANDI|48324/dandi", sentence, re.IGNORECASE):
-                    # Clean up whitespace
-                    clean = " ".join(sentence.split())
-                    mentions.append(f"[Page {page_num}] {clean}")
+        # Find sentences containing DANDI
+        for sentence in _iter_sentences(text):
+            if _DANDI_NEEDLE in sentence.lower():
+                # Clean up whitespace
+                clean = " ".join(sentence.split())
+                mentions.append(f"[Page {page_num}] {clean}")
 
     return mentions
 
 
-def extract_dandi_mentions_html(html_path: Path) -> list[str]:
-    """Extract text snippets mentioning DANDI from HTML.
+def _html_to_text(content: str) -> str:
+    """Extract visible text from an HTML document.
 
-    Returns list of context strings around DANDI mentions.
+    Uses a C-backed parser (selectolax, then lxml) when available and falls
+    back to the stdlib HTMLParser otherwise.
     """
+    try:
+        from selectolax.parser import HTMLParser as SelectolaxParser
+    except ImportError:
+        pass
+    else:
+        tree = SelectolaxParser(content)
+        node = tree.body or tree.root
+        return node.text(separator=" ") if node is not None else ""
+
+    try:
+        import lxml.html
+    except ImportError:
+        pass
+    else:
+        try:
+            return " ".join(lxml.html.fromstring(content).itertext())
+        except ValueError:
+            # lxml rejects str input carrying an <?xml ... encoding=...?>
+            # declaration (common in XHTML/publisher HTML); the stdlib parser
+            # below handles those
+            pass
+
     from html.parser import HTMLParser
 
-    class TextExtractor(HTMLParser):
-        def __init__(self):
-            super().__init__()
-            self.text_chunks = []
-            self.current_text = []
+    chunks: list[str] = []
+    parser = HTMLParser()
+    parser.handle_data = chunks.append  # type: ignore[method-assign]
+    parser.feed(content)
+    return " ".join(chunks)
 
-        def handle_data(self, data):
-            self.current_text.append(data)
 
-        def get_text(self):
-            return " ".join(self.current_text)
+def extract_dandi_mentions_html(html_path: Path) -> list[str]:
+    """Extract text snippets mentioning DANDI from HTML.
 
+    Returns list of context strings around DANDI mentions.
+    """
     try:
         content = html_path.read_text(encoding="utf-8")
     except UnicodeDecodeError:
         content = html_path.read_text(encoding="latin-1")
 
-    parser = TextExtractor()
-    parser.feed(content)
-    text = parser.get_text()
+    # Visible text is a subset of the markup, so skip parsing papers that
+    # cannot mention DANDI at all
+    if _DANDI_NEEDLE not in content.lower():
+        return []
+
+    text = _html_to_text(content)
+    if _DANDI_NEEDLE not in text.lower():
+        return []
 
     # Find sentences containing DANDI
     mentions = []
-    sentences = re.split(r"[.!?]\s+", text)
-    for sentence in sentences:
-        if re.search(r"DANDI|48324/dandi", sentence, re.IGNORECASE):
+    for sentence in _iter_sentences(text):
+        if _DANDI_NEEDLE in sentence.lower():
             clean = " ".join(sentence.split())
             if len(clean) > 50:  # Filter very short fragments
                 mentions.append(clean)
@@ -87,41 +240,70 @@ def extract_dandi_mentions_html(html_path: Path) -> list[str]:
     return mentions
 
 
-def classify_relationship_from_text(text: str) -> list[str]:
-    """Suggest relationship types based on textual patterns."""
+@functools.lru_cache(maxsize=4096)
+def classify_relationship_from_text(text: str) -> tuple[str, ...]:
+    """Suggest relationship types based on textual patterns.
+
+    Results are cached since boilerplate sentences recur across papers.
+    """
     text_lower = text.lower()
-    suggestions = []
+    found: set[str] = set()
 
-    # Data descriptor language
-    if re.search(r"dataset (is )?(available|deposited|published|released)", text_lower):
-        suggestions.append("IsDocumentedBy")
+    if _HYPERSCAN_DB is not None:
 
-    # Active data use
-    use_pattern = r"(we |authors )?(used|analyzed|examined|studied|processed|downloaded)"
-    if re.search(use_pattern + r" (the )?(data|dataset)", text_lower):
-        suggestions.append("Uses/UsesDataFrom")
+        def on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> None:
+            found.update(_GROUP_TO_LABELS[_HYPERSCAN_GROUPS[pattern_id]])
 
-    # Validation/evidence
-    if re.search(r"validat(e|ed|ion)|benchmark(ed|ing)|test(ed|ing)|evaluat(e|ed|ion)", text_lower):
-        suggestions.append("CitesAsEvidence")
+        _HYPERSCAN_DB.scan(text_lower.encode("utf-8", "replace"), match_event_handler=on_match)
+    else:
+        for match in _CLASSIFIER.finditer(text_lower):
+            found.update(_GROUP_TO_LABELS[match.lastgroup])  # type: ignore[index]
 
     # Multiple datasets
-    if text.count("dandi") > 1 or re.search(r"datasets|combined|aggregated|pooled", text_lower):
-        suggestions.append("Compiles")
+    if text.count("dandi") > 1:
+        found.add("Compiles")
+
+    suggestions = tuple(label for label in _LABEL_ORDER if label in found)
+    return suggestions or ("Cites (generic)",)
+
+
+def find_papers(root: Path) -> list[Path]:
+    """Find PDF and HTML papers under root, PDFs first.
 
-    # Review language
-    if re.search(r"review(ed|ing)?|evaluat(e|ed|ion)|assess(ed|ment)|survey", text_lower):
-        suggestions.append("Reviews")
+    Walks the tree once with os.walk (scandir-based) instead of two rglob
+    passes, matching on the bare file name and only building Path objects
+    for the hits.
+    """
+    pdfs: list[Path] = []
+    htmls: list[Path] = []
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for name in filenames:
+            if name.endswith(".pdf"):
+                pdfs.append(Path(dirpath, name))
+            elif name.endswith(".html"):
+                htmls.append(Path(dirpath, name))
+    return pdfs + htmls
 
-    # Derivation
-    if re.search(r"derived|based on|preprocessed|spike.?sorted|transformed", text_lower):
-        suggestions.append("IsDerivedFrom")
 
-    # Background reference
-    if re.search(r"(publicly )?available|repository|archive|resource", text_lower):
-        suggestions.append("References/CitesForInformation")
+def analyze_one(paper_path: Path) -> dict[str, Any]:
+    """Extract and classify DANDI mentions from a single paper.
 
-    return suggestions or ["Cites (generic)"]
+    Runs in a worker process, so it only returns plain data.
+    """
+    if paper_path.suffix == ".pdf":
+        mentions = extract_dandi_mentions_pdf(paper_path)
+    else:
+        mentions = extract_dandi_mentions_html(paper_path)
+
+    return {
+        "path": paper_path,
+        "total_mentions": len(mentions),
+        # Only the first 3 mentions are classified and reported
+        "mentions": [
+            {"text": mention, "suggested": list(classify_relationship_from_text(mention))}
+            for mention in mentions[:3]
+        ],
+    }
 
 
 @click.command()
@@ -139,13 +321,19 @@ def classify_relationship_from_text(text: str) -> list[str]:
     type=click.Path(path_type=Path),
     help="Save analysis to markdown file",
 )
-def main(pdfs_dir: Path, sample: int, output: Path | None) -> None:
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    help="Number of worker processes (default: number of CPUs)",
+)
+def main(pdfs_dir: Path, sample: int, output: Path | None, jobs: int | None) -> None:
     """Analyze collected PDFs/HTMLs to understand citation patterns.
 
     PDFS_DIR: Directory containing collected papers (e.g., /path/to/dandi-bib/citations/pdfs)
     """
     # Find all PDFs and HTMLs
-    papers = list(pdfs_dir.rglob("*.pdf")) + list(pdfs_dir.rglob("*.html"))
+    papers = find_papers(pdfs_dir)
 
     if not papers:
         click.echo(f"No PDFs or HTMLs found in {pdfs_dir}", err=True)
@@ -154,34 +342,30 @@ def main(pdfs_dir: Path, sample: int, output: Path | None) -> None:
     click.echo(f"Found {len(papers)} papers. Analyzing {min(sample, len(papers))}...\n")
 
     results = []
+    selected = papers[:sample]
+
+    # Papers are independent and extraction is CPU-bound, so fan out across
+    # processes; map() yields in submission order, keeping the report ordered.
+    # ~8 chunks per worker balances IPC overhead against uneven paper sizes.
+    workers = jobs or os.cpu_count() or 1
+    chunksize = max(1, len(selected) // (8 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        analyses = executor.map(analyze_one, selected, chunksize=chunksize)
+        for i, analysis in enumerate(analyses, 1):
+            click.echo(f"[{i}/{len(selected)}] Analyzing {analysis['path'].name}...")
+
+            if not analysis["total_mentions"]:
+                click.echo("  ⚠️  No DANDI mentions found\n")
+                continue
 
-    for i, paper_path in enumerate(papers[:sample], 1):
-        click.echo(f"[{i}/{min(sample, len(papers))}] Analyzing {paper_path.name}...")
-
-        # Extract DANDI mentions
-        if paper_path.suffix == ".pdf":
-            mentions = extract_dandi_mentions_pdf(paper_path)
-        else:
-            mentions = extract_dandi_mentions_html(paper_path)
-
-        if not mentions:
-            click.echo("  ⚠️  No DANDI mentions found\n")
-            continue
-
-        click.echo(f"  Found {len(mentions)} DANDI mention(s)")
-
-        # Classify each mention
-        analysis = {"path": paper_path, "mentions": []}
-
-        for mention in mentions[:3]:  # Show first 3 mentions
-            suggested = classify_relationship_from_text(mention)
-            analysis["mentions"].append({"text": mention, "suggested": suggested})
+            click.echo(f"  Found {analysis['total_mentions']} DANDI mention(s)")
 
-            click.echo(f"  📄 {mention[:100]}...")
-            click.echo(f"     → Suggested: {', '.join(suggested)}")
+            for mention in analysis["mentions"]:
+                click.echo(f"  📄 {mention['text'][:100]}...")
+                click.echo(f"     → Suggested: {', '.join(mention['suggested'])}")
 
-        results.append(analysis)
-        click.echo()
+            results.append(analysis)
+            click.echo()
 
     # Summary statistics
     all_suggestions = []
@@ -193,8 +377,6 @@ def main(pdfs_dir: Path, sample: int, output: Path | None) -> None:
     click.echo("SUMMARY")
     click.echo("=" * 80)
 
-    from collections import Counter
-
     counts = Counter(all_suggestions)
     click.echo("\nSuggested relationship types (total mentions):")
     for rel_type, count in counts.most_common():
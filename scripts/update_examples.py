@@ -11,7 +11,13 @@ This script:
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
+import re
 import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -27,13 +33,62 @@ YELLOW = "\033[93m"
 BLUE = "\033[94m"
 RESET = "\033[0m"
 
+# Collections require a "name" key, so files without any name key (in block
+# or flow style, possibly after a BOM) are skipped before paying for a full
+# YAML parse and schema validation. Files that do have one are always loaded.
+_COLLECTION_SNIFF = re.compile(rb"""(?:^|[\s{,]|\xef\xbb\xbf)["']?name["']?\s*:""")
 
-def update_collection(yaml_path: Path) -> dict[str, Any]:
+
+def _looks_like_collection(yaml_path: Path) -> bool:
+    """Cheap check that yaml_path could be a collection file (no false negatives)."""
+    return _COLLECTION_SNIFF.search(yaml_path.read_bytes()) is not None
+
+
+def _manifest_path(yaml_path: Path) -> Path:
+    """Sidecar recording the YAML content hash of the last successful update."""
+    return yaml_path.with_name(f"{yaml_path.name}.cache.json")
+
+
+def _yaml_hash(yaml_path: Path) -> str:
+    """Content hash of the collection YAML."""
+    return hashlib.blake2b(yaml_path.read_bytes(), digest_size=16).hexdigest()
+
+
+def _is_unchanged(yaml_path: Path, tsv_path: Path) -> bool:
+    """Whether yaml_path is unchanged since its last successful update."""
+    try:
+        manifest = json.loads(_manifest_path(yaml_path).read_text())
+        tsv_mtime = tsv_path.stat().st_mtime_ns
+    except (OSError, ValueError):
+        return False
+    return (
+        manifest.get("yaml_hash") == _yaml_hash(yaml_path)
+        and tsv_mtime >= yaml_path.stat().st_mtime_ns
+    )
+
+
+def _count_rows(tsv_path: Path) -> int:
+    """Number of citation rows in a TSV file, without parsing them."""
+    with tsv_path.open("rb") as f:
+        return max(sum(1 for line in f if line.strip()) - 1, 0)
+
+
+def update_collection(
+    yaml_path: Path,
+    echo: Callable[..., None] = click.echo,
+    skip_unchanged: bool = False,
+    progress: bool = True,
+) -> dict[str, Any]:
     """
     Update citations for a single collection.
 
     Args:
         yaml_path: Path to collection YAML file
+        echo: Callable used for progress output (default: click.echo)
+        skip_unchanged: Skip discovery if the YAML is unchanged since the
+            last successful update and its TSV is still newer than it
+        progress: Show the discovery progress bar; disable when updating
+            several collections in parallel
 
     Returns:
         Dictionary with update statistics
@@ -56,12 +111,18 @@ def update_collection(yaml_path: Path) -> dict[str, Any]:
         # Determine TSV output path from collection config
         tsv_path = yaml_path.parent / (collection.output_tsv or f"{yaml_path.stem}-citations.tsv")
 
+        if skip_unchanged and _is_unchanged(yaml_path, tsv_path):
+            stats["status"] = "skipped"
+            stats["total_citations"] = _count_rows(tsv_path)
+            echo(f"  Unchanged since last update, skipping (see {_manifest_path(yaml_path).name})")
+            return stats
+
         # Create collector and load existing citations
         collector = CitationCollector(collection)
 
         # Load existing citations if TSV exists
         if tsv_path.exists():
-            click.echo(f"  Loading existing citations from {tsv_path.name}")
+            echo(f"  Loading existing citations from {tsv_path.name}")
             collector.load_existing_citations(tsv_path)
             existing_count = len(collector.citations)
         else:
@@ -69,7 +130,7 @@ def update_collection(yaml_path: Path) -> dict[str, Any]:
 
         # Populate items from source if configured (e.g., DANDI API)
         if collection.source and collection.source.type:
-            click.echo(f"  Populating items from {collection.source.type} source...")
+            echo(f"  Populating items from {collection.source.type} source...")
             collector.populate_from_source()
 
         # Discover citations
@@ -82,8 +143,8 @@ def update_collection(yaml_path: Path) -> dict[str, Any]:
             collection.discover.email if collection.discover and collection.discover.email else None
         )
 
-        click.echo(f"  Discovering citations from {sources or 'default sources'}...")
-        collector.discover_all(sources=sources, email=email, incremental=True)
+        echo(f"  Discovering citations from {sources or 'default sources'}...")
+        collector.discover_all(sources=sources, email=email, incremental=True, progress=progress)
 
         # Calculate new citations
         stats["new_citations"] = len(collector.citations) - existing_count
@@ -91,19 +152,33 @@ def update_collection(yaml_path: Path) -> dict[str, Any]:
 
         # Save updated collection and citations
         collector.save(yaml_path, tsv_path)
+        _manifest_path(yaml_path).write_text(json.dumps({"yaml_hash": _yaml_hash(yaml_path)}))
 
-        click.echo(
-            f"  {GREEN}✓{RESET} Saved {stats['total_citations']} citations to {tsv_path.name}"
-        )
+        echo(f"  {GREEN}✓{RESET} Saved {stats['total_citations']} citations to {tsv_path.name}")
 
     except Exception as e:
         stats["status"] = "error"
         stats["error"] = str(e)
-        click.echo(f"  {YELLOW}✗{RESET} Error: {e}", err=True)
+        echo(f"  {YELLOW}✗{RESET} Error: {e}", err=True)
 
     return stats
 
 
+def _update_buffered(
+    yaml_path: Path, skip_unchanged: bool = False, progress: bool = True
+) -> tuple[dict[str, Any], list[tuple[str, bool]]]:
+    """Run update_collection, buffering its output so it can be flushed as one block."""
+    lines: list[tuple[str, bool]] = []
+
+    def echo(message: str = "", err: bool = False) -> None:
+        lines.append((message, err))
+
+    stats = update_collection(
+        yaml_path, echo=echo, skip_unchanged=skip_unchanged, progress=progress
+    )
+    return stats, lines
+
+
 @click.command()
 @click.option(
     "--examples-dir",
@@ -111,7 +186,19 @@ def update_collection(yaml_path: Path) -> dict[str, Any]:
     default="examples",
     help="Directory containing example collection YAML files",
 )
-def main(examples_dir: Path) -> None:
+@click.option(
+    "--jobs",
+    "-j",
+    default=4,
+    type=click.IntRange(min=1),
+    help="Number of collections to update concurrently (default: 4)",
+)
+@click.option(
+    "--skip-unchanged",
+    is_flag=True,
+    help="Skip collections whose YAML is unchanged since their last successful update",
+)
+def main(examples_dir: Path, jobs: int, skip_unchanged: bool) -> None:
     """Update all example collections with latest citations."""
     click.echo(f"\n{BOLD}Updating Example Citations{RESET}\n")
 
@@ -122,11 +209,14 @@ def main(examples_dir: Path) -> None:
     yaml_files = []
     for yaml_path in all_yaml_files:
         try:
-            yaml_io.load_collection(yaml_path)
-            yaml_files.append(yaml_path)
+            if _looks_like_collection(yaml_path):
+                yaml_io.load_collection(yaml_path)
+                yaml_files.append(yaml_path)
+                continue
         except Exception:
-            # Skip files that aren't valid collections (e.g., GitHub workflows)
-            click.echo(f"  Skipping non-collection file: {yaml_path.name}")
+            pass
+        # Skip files that aren't valid collections (e.g., GitHub workflows)
+        click.echo(f"  Skipping non-collection file: {yaml_path.name}")
 
     if not yaml_files:
         click.echo(f"{YELLOW}No valid collection YAML files found in {examples_dir}{RESET}")
@@ -134,13 +224,21 @@ def main(examples_dir: Path) -> None:
 
     click.echo(f"\nFound {len(yaml_files)} collection(s) to update\n")
 
-    # Update each collection
+    # Update collections concurrently; discovery is dominated by network waits.
+    # Each collection's output is buffered and flushed in order once it is done.
+    # Progress bars (and their logging redirection, which swaps the root
+    # logger's handlers) are only safe with a single worker.
+    update = functools.partial(_update_buffered, skip_unchanged=skip_unchanged, progress=jobs == 1)
     all_stats = []
-    for yaml_path in yaml_files:
-        click.echo(f"{BOLD}{BLUE}Processing:{RESET} {yaml_path.name}")
-        stats = update_collection(yaml_path)
-        all_stats.append(stats)
-        click.echo()
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        for yaml_path, (stats, lines) in zip(
+            yaml_files, executor.map(update, yaml_files), strict=True
+        ):
+            click.echo(f"{BOLD}{BLUE}Processing:{RESET} {yaml_path.name}")
+            for message, err in lines:
+                click.echo(message, err=err)
+            all_stats.append(stats)
+            click.echo()
 
     # Print summary
     click.echo(f"\n{BOLD}{'=' * 60}{RESET}")
@@ -149,9 +247,18 @@ def main(examples_dir: Path) -> None:
     total_new = 0
     total_citations = 0
     success_count = 0
+    skipped_count = 0
     error_count = 0
 
     for stats in all_stats:
+        if stats["status"] == "skipped":
+            skipped_count += 1
+            total_citations += stats["total_citations"]
+            click.echo(
+                f"  - {stats['name']}: skipped (unchanged), {stats['total_citations']} total"
+            )
+            continue
+
         status_icon = f"{GREEN}✓{RESET}" if stats["status"] == "success" else f"{YELLOW}✗{RESET}"
         click.echo(
             f"  {status_icon} {stats['name']}: "
@@ -167,7 +274,9 @@ def main(examples_dir: Path) -> None:
             error_count += 1
 
     click.echo(f"\n{BOLD}Overall:{RESET}")
-    click.echo(f"  Collections updated: {success_count}/{len(all_stats)}")
+    click.echo(f"  Collections updated: {success_count}/{len(all_stats) - skipped_count}")
+    if skipped_count:
+        click.echo(f"  Collections skipped (unchanged): {skipped_count}")
     click.echo(f"  New citations: {total_new:+d}")
     click.echo(f"  Total citations: {total_citations}")
 
@@ -175,7 +284,13 @@ def main(examples_dir: Path) -> None:
         click.echo(f"\n{YELLOW}Errors occurred in {error_count} collection(s){RESET}")
         sys.exit(1)
 
-    click.echo(f"\n{GREEN}All collections updated successfully!{RESET}\n")
+    if skipped_count:
+        click.echo(
+            f"\n{GREEN}All collections up to date "
+            f"({success_count} updated, {skipped_count} unchanged){RESET}\n"
+        )
+    else:
+        click.echo(f"\n{GREEN}All collections updated successfully!{RESET}\n")
 
 
 if __name__ == "__main__":
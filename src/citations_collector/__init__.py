@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from citations_collector.core import CitationCollector
-from citations_collector.models import CitationRecord, Collection
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from citations_collector.core import CitationCollector
+    from citations_collector.models import CitationRecord, Collection
 
 __all__ = [
     "__version__",
@@ -16,3 +19,17 @@ try:
     from citations_collector._version import version as __version__
 except ImportError:
     __version__ = "0.0.0+unknown"
+
+
+def __getattr__(name: str) -> Any:
+    # Public API is imported on first access, so that importing a submodule
+    # (e.g. the CLI) doesn't load the models and HTTP clients up front
+    if name == "CitationCollector":
+        from citations_collector.core import CitationCollector
+
+        return CitationCollector
+    if name in ("CitationRecord", "Collection"):
+        from citations_collector import models
+
+        return getattr(models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
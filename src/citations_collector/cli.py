@@ -8,13 +8,17 @@ from pathlib import Path
 
 import click
 
-from citations_collector.core import CitationCollector
-from citations_collector.importers.dandi import DANDIImporter
-from citations_collector.importers.zotero import ZoteroImporter
-from citations_collector.persistence import yaml_io
+# Heavy imports (models, HTTP clients, YAML) are deferred into the commands
+# that need them, so that `--help` and `--version` start quickly.
 
 logger = logging.getLogger(__name__)
 
+# Parameter types shared across commands, built once at import
+_EXISTING_PATH = click.Path(exists=True, path_type=Path)
+_OUTPUT_PATH = click.Path(path_type=Path)
+_POSITIVE_INT = click.IntRange(min=1)
+_SOURCE_CHOICE = click.Choice(["crossref", "opencitations", "datacite", "openalex"])
+
 
 @click.group()
 @click.version_option()
@@ -28,11 +32,11 @@ def main(verbose: bool) -> None:
 
 
 @main.command()
-@click.argument("collection", type=click.Path(exists=True, path_type=Path))
+@click.argument("collection", type=_EXISTING_PATH)
 @click.option(
     "--output",
     "-o",
-    type=click.Path(path_type=Path),
+    type=_OUTPUT_PATH,
     help="Output TSV file (overrides collection YAML output_tsv)",
 )
 @click.option(
@@ -53,7 +57,7 @@ def main(verbose: bool) -> None:
 @click.option(
     "--sources",
     multiple=True,
-    type=click.Choice(["crossref", "opencitations", "datacite", "openalex"]),
+    type=_SOURCE_CHOICE,
     help="Which sources to query (overrides discover.sources in YAML)",
 )
 @click.option(
@@ -61,6 +65,11 @@ def main(verbose: bool) -> None:
     is_flag=True,
     help="Expand non-DOI refs (zenodo_concept, github) to DOIs before discovery",
 )
+@click.option(
+    "--concurrency",
+    type=_POSITIVE_INT,
+    help="Maximum concurrent requests per source (default: 8 for CrossRef, 4 for others)",
+)
 def discover(
     collection: Path,
     output: Path | None,
@@ -69,8 +78,11 @@ def discover(
     email: str | None,
     sources: tuple[str, ...],
     expand_refs: bool,
+    concurrency: int | None,
 ) -> None:
     """Discover citations for all items in COLLECTION."""
+    from citations_collector.core import DEFAULT_CONCURRENCY, CitationCollector
+
     click.echo(f"Loading collection from {collection}")
 
     # Load collection
@@ -115,6 +127,7 @@ def discover(
         incremental=not full_refresh,
         since_date=since,
         email=email,
+        concurrency=dict.fromkeys(DEFAULT_CONCURRENCY, concurrency) if concurrency else None,
     )
 
     # Report results
@@ -131,7 +144,7 @@ def discover(
     "--output",
     "-o",
     required=True,
-    type=click.Path(path_type=Path),
+    type=_OUTPUT_PATH,
     help="Output YAML file for collection",
 )
 @click.option(
@@ -157,12 +170,19 @@ def discover(
     is_flag=True,
     help="Import all dandisets (default if no --dandiset-id specified)",
 )
+@click.option(
+    "--concurrency",
+    default=8,
+    type=_POSITIVE_INT,
+    help="Number of dandisets fetched concurrently (default: 8)",
+)
 def import_dandi(
     output: Path,
     include_draft: bool,
     limit: int | None,
     dandiset_ids: tuple[str, ...],
     import_all: bool,
+    concurrency: int,
 ) -> None:
     """Import dandisets from DANDI Archive.
 
@@ -177,6 +197,9 @@ def import_dandi(
       # Import all dandisets (with limit)
       citations-collector import-dandi -o all.yaml --all --limit 10
     """
+    from citations_collector.importers.dandi import DANDIImporter
+    from citations_collector.persistence import yaml_io
+
     importer = DANDIImporter()
 
     # Determine what to import
@@ -193,6 +216,7 @@ def import_dandi(
                 dandiset_ids=list(dandiset_ids),
                 include_draft=include_draft,
                 progress_callback=progress,
+                concurrency=concurrency,
             )
     else:
         # Import all dandisets
@@ -213,6 +237,7 @@ def import_dandi(
                 include_draft=include_draft,
                 limit=limit,
                 progress_callback=progress if limit else None,
+                concurrency=concurrency,
             )
 
     yaml_io.save_collection(collection, output)
@@ -224,7 +249,7 @@ def import_dandi(
     "--output",
     "-o",
     required=True,
-    type=click.Path(path_type=Path),
+    type=_OUTPUT_PATH,
     help="Output YAML file for collection",
 )
 @click.option(
@@ -255,6 +280,9 @@ def import_zotero(
     limit: int | None,
 ) -> None:
     """Import items from a Zotero group."""
+    from citations_collector.importers.zotero import ZoteroImporter
+    from citations_collector.persistence import yaml_io
+
     click.echo(f"Importing items from Zotero group {group_id}...")
 
     importer = ZoteroImporter(api_key=api_key)
@@ -269,10 +297,10 @@ def import_zotero(
 
 
 @main.command("sync-zotero")
-@click.argument("collection", type=click.Path(exists=True, path_type=Path))
+@click.argument("collection", type=_EXISTING_PATH)
 @click.option(
     "--tsv",
-    type=click.Path(exists=True, path_type=Path),
+    type=_EXISTING_PATH,
     help="Citations TSV file (overrides collection YAML output_tsv)",
 )
 @click.option(
@@ -299,6 +327,7 @@ def sync_zotero(
     dry_run: bool,
 ) -> None:
     """Sync citations to Zotero as hierarchical collections."""
+    from citations_collector.core import CitationCollector
     from citations_collector.persistence import tsv_io
     from citations_collector.zotero_sync import ZoteroSyncer
 
@@ -342,15 +371,15 @@ def sync_zotero(
 
 
 @main.command("fetch-pdfs")
-@click.argument("collection", type=click.Path(exists=True, path_type=Path))
+@click.argument("collection", type=_EXISTING_PATH)
 @click.option(
     "--tsv",
-    type=click.Path(path_type=Path),
+    type=_OUTPUT_PATH,
     help="Citations TSV file (overrides collection YAML output_tsv)",
 )
 @click.option(
     "--output-dir",
-    type=click.Path(path_type=Path),
+    type=_OUTPUT_PATH,
     help="PDF output directory (overrides pdfs.output_dir in YAML)",
 )
 @click.option(
@@ -369,6 +398,7 @@ def fetch_pdfs(
     dry_run: bool,
 ) -> None:
     """Fetch open-access PDFs for citations in COLLECTION."""
+    from citations_collector.core import CitationCollector
     from citations_collector.pdf import PDFAcquirer
     from citations_collector.persistence import tsv_io
 
@@ -421,12 +451,12 @@ def fetch_pdfs(
 @click.option(
     "--config",
     "-c",
-    type=click.Path(exists=True, path_type=Path),
+    type=_EXISTING_PATH,
     help="Path to collection YAML config",
 )
 @click.option(
     "--tsv",
-    type=click.Path(exists=True, path_type=Path),
+    type=_EXISTING_PATH,
     help="Override: path to TSV file (default: from config)",
 )
 @click.option(
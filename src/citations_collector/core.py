@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
 
@@ -16,12 +19,22 @@ from citations_collector.discovery import (
     OpenAlexDiscoverer,
     OpenCitationsDiscoverer,
 )
+from citations_collector.discovery.base import AbstractDiscoverer
 from citations_collector.discovery.utils import deduplicate_citations
-from citations_collector.models import CitationRecord, Collection
+from citations_collector.models import CitationRecord, Collection, Item, ItemFlavor, ItemRef
 from citations_collector.persistence import tsv_io, yaml_io
 
 logger = logging.getLogger(__name__)
 
+# Default number of concurrent requests per discovery source. Queries are
+# I/O-bound; the caps stay modest to respect each provider's rate limits.
+DEFAULT_CONCURRENCY: dict[str, int] = {
+    "crossref": 8,
+    "opencitations": 4,
+    "datacite": 4,
+    "openalex": 4,
+}
+
 
 class CitationCollector:
     """
@@ -209,6 +222,7 @@ class CitationCollector:
         github_token: str | None = None,
         zenodo_token: str | None = None,
         expand_types: list[str] | None = None,
+        concurrency: int = 8,
     ) -> None:
         """
         Expand non-DOI references to DOI references.
@@ -223,6 +237,7 @@ class CitationCollector:
             github_token: Optional GitHub token for API rate limits
             zenodo_token: Optional Zenodo token for authentication
             expand_types: Which ref types to expand (default: ["zenodo_concept", "github"])
+            concurrency: Maximum concurrent expansion requests
         """
         from citations_collector.importers import GitHubMapper, ZenodoExpander
 
@@ -240,32 +255,47 @@ class CitationCollector:
             GitHubMapper(github_token=github_token) if "github" in expand_types else None
         )
 
+        def expand(ref: ItemRef) -> list[ItemRef]:
+            if ref.ref_type == "zenodo_concept" and zenodo_expander:
+                return zenodo_expander.expand(ref.ref_value)
+            if ref.ref_type == "github" and github_mapper:
+                doi_ref = github_mapper.map_to_doi(ref.ref_value)
+                return [doi_ref] if doi_ref else []
+            return []
+
+        # Collect refs to expand up front; each expansion is an independent
+        # API lookup, so they run concurrently
+        work: list[tuple[ItemFlavor, ItemRef]] = []
         for item in self.collection.items:
             for flavor in item.flavors:
-                # Collect expanded refs
-                expanded_refs = []
-
                 for ref in flavor.refs:
                     # Expand zenodo_concept to all version DOIs
                     if ref.ref_type == "zenodo_concept" and zenodo_expander:
                         logger.info(f"Expanding Zenodo concept {ref.ref_value} for {item.item_id}")
-                        doi_refs = zenodo_expander.expand(ref.ref_value)
-                        expanded_refs.extend(doi_refs)
+                        work.append((flavor, ref))
 
                     # Map github to Zenodo DOI
                     elif ref.ref_type == "github" and github_mapper:
                         logger.info(f"Mapping GitHub {ref.ref_value} to DOI for {item.item_id}")
-                        doi_ref = github_mapper.map_to_doi(ref.ref_value)
-                        if doi_ref:
-                            expanded_refs.append(doi_ref)
+                        work.append((flavor, ref))
+
+        if not work:
+            return
 
-                # Add expanded refs to flavor, avoiding duplicates
-                existing_ref_values = {(ref.ref_type, ref.ref_value) for ref in flavor.refs}
-                for expanded_ref in expanded_refs:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [(flavor, executor.submit(expand, ref)) for flavor, ref in work]
+
+            # Add expanded refs to flavors in collection order, avoiding duplicates
+            existing_ref_values: dict[int, set[tuple[str, str]]] = {}
+            for flavor, future in futures:
+                seen = existing_ref_values.setdefault(
+                    id(flavor), {(ref.ref_type, ref.ref_value) for ref in flavor.refs}
+                )
+                for expanded_ref in future.result():
                     ref_key = (expanded_ref.ref_type, expanded_ref.ref_value)
-                    if ref_key not in existing_ref_values:
+                    if ref_key not in seen:
                         flavor.refs.append(expanded_ref)
-                        existing_ref_values.add(ref_key)
+                        seen.add(ref_key)
 
     def _get_most_recent_discovery_date(self) -> datetime | None:
         """
@@ -341,19 +371,31 @@ class CitationCollector:
         incremental: bool = True,
         since_date: datetime | None = None,
         email: str | None = None,
+        concurrency: dict[str, int] | None = None,
+        progress: bool = True,
     ) -> None:
         """
         Discover citations for all items in collection.
 
+        Queries run concurrently, with a separate thread pool per source so
+        that each provider gets its own cap on in-flight requests.
+
         Args:
             sources: Which discoverers to use (default: all available)
                      Available: "crossref", "opencitations", "datacite", "openalex"
             incremental: Derive since date from existing citations for incremental discovery
             since_date: Optional explicit since date (overrides incremental)
             email: Email for CrossRef polite pool
+            concurrency: Maximum concurrent requests per source
+                         (default: DEFAULT_CONCURRENCY)
+            progress: Show a progress bar, routing logging through tqdm while
+                      it runs. Pass False when several collectors run in
+                      parallel threads, which would otherwise interleave their
+                      bars and race on the root logger's handlers.
         """
         if sources is None:
             sources = ["crossref", "opencitations", "datacite", "openalex"]
+        concurrency = {**DEFAULT_CONCURRENCY, **(concurrency or {})}
 
         # Initialize discoverers
         discoverers: list[
@@ -386,53 +428,89 @@ class CitationCollector:
         if not self.collection.items:
             return
 
-        # Count total refs for progress bar
-        total_refs = sum(
-            len(flavor.refs) for item in self.collection.items for flavor in item.flavors
-        )
+        # Pair each ref only with the discoverers that support its type, so
+        # e.g. github refs don't cost a no-op call (and warning) per source
+        by_ref_type: dict[str, list[tuple[str, AbstractDiscoverer]]] = defaultdict(list)
+        for source_name, discoverer in discoverers:
+            for ref_type in discoverer.supported_ref_types:
+                by_ref_type[ref_type].append((source_name, discoverer))
+
+        queries = [
+            (item, flavor, ref, source_name, discoverer)
+            for item in self.collection.items
+            for flavor in item.flavors
+            for ref in flavor.refs
+            for source_name, discoverer in by_ref_type.get(ref.ref_type, ())
+        ]
+
+        executors = {
+            source_name: ThreadPoolExecutor(
+                max_workers=max(1, concurrency.get(source_name, 1)),
+                thread_name_prefix=f"discover-{source_name}",
+            )
+            for source_name, _ in discoverers
+        }
 
         # Create progress bar with logging redirection
         # Disable only if DEBUG logging is enabled (so debug messages are visible)
         with (
-            logging_redirect_tqdm(),
+            logging_redirect_tqdm() if progress else nullcontext(),
             tqdm(
-                total=total_refs * len(discoverers),
+                total=len(queries),
                 desc="Discovering citations",
                 unit="query",
-                disable=logger.getEffectiveLevel() <= logging.DEBUG,
+                disable=not progress or logger.getEffectiveLevel() <= logging.DEBUG,
             ) as pbar,
         ):
-            for item in self.collection.items:
-                for flavor in item.flavors:
-                    for ref in flavor.refs:
-                        for source_name, discoverer in discoverers:
-                            try:
-                                citations = discoverer.discover(ref, since=since)
-
-                                # Fill in item context and track source
-                                for citation in citations:
-                                    citation.item_id = item.item_id
-                                    citation.item_flavor = flavor.flavor_id
-                                    citation.item_ref_type = ref.ref_type
-                                    citation.item_ref_value = ref.ref_value
-                                    citation.item_name = item.name
-                                    # Track which source found this citation
-                                    citation.citation_source = source_name  # type: ignore[assignment]
-
-                                all_citations.extend(citations)
-                                logger.debug(
-                                    f"{source_name}: {len(citations)} citations "
-                                    f"for {item.item_id}/{flavor.flavor_id}"
-                                )
-
-                            except Exception as e:
-                                logger.error(
-                                    f"Error discovering from {source_name} "
-                                    f"for {item.item_id}/{flavor.flavor_id}: {e}"
-                                )
-
-                            # Update progress
-                            pbar.update(1)
+
+            def query(
+                item: Item,
+                flavor: ItemFlavor,
+                ref: ItemRef,
+                source_name: str,
+                discoverer: AbstractDiscoverer,
+            ) -> list[CitationRecord]:
+                try:
+                    citations = discoverer.discover(ref, since=since)
+
+                    # Fill in item context and track source
+                    for citation in citations:
+                        citation.item_id = item.item_id
+                        citation.item_flavor = flavor.flavor_id
+                        citation.item_ref_type = ref.ref_type
+                        citation.item_ref_value = ref.ref_value
+                        citation.item_name = item.name
+                        # Track which source found this citation
+                        citation.citation_source = source_name  # type: ignore[assignment]
+
+                    logger.debug(
+                        f"{source_name}: {len(citations)} citations "
+                        f"for {item.item_id}/{flavor.flavor_id}"
+                    )
+                    return citations
+
+                except Exception as e:
+                    logger.error(
+                        f"Error discovering from {source_name} "
+                        f"for {item.item_id}/{flavor.flavor_id}: {e}"
+                    )
+                    return []
+
+                finally:
+                    # Update progress
+                    pbar.update(1)
+
+            try:
+                futures: list[Future[list[CitationRecord]]] = [
+                    executors[source_name].submit(query, item, flavor, ref, source_name, discoverer)
+                    for item, flavor, ref, source_name, discoverer in queries
+                ]
+                # Collect in submission order so deduplication stays deterministic
+                for future in futures:
+                    all_citations.extend(future.result())
+            finally:
+                for executor in executors.values():
+                    executor.shutdown(cancel_futures=True)
 
         # Deduplicate and merge with existing
         unique_citations = deduplicate_citations(all_citations)
@@ -11,6 +11,9 @@ from citations_collector.models import CitationRecord, ItemRef
 class AbstractDiscoverer(ABC):
     """Base class for citation discovery APIs."""
 
+    # Ref types discover() can query; the collector skips refs of other types
+    supported_ref_types: frozenset[str] = frozenset({"doi"})
+
     @abstractmethod
     def discover(self, item_ref: ItemRef, since: datetime | None = None) -> list[CitationRecord]:
         """
@@ -3,46 +3,107 @@
 from __future__ import annotations
 
 import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, cast
 
 import requests
-from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from citations_collector.discovery.base import AbstractDiscoverer
+from citations_collector.discovery.utils import (
+    DOI_CACHE_ENV_VAR,
+    DOIMetadataCache,
+    mount_rate_limited,
+    parse_json,
+    strip_doi_prefix,
+)
 from citations_collector.models import CitationRecord, CitationSource, ItemRef
 
 logger = logging.getLogger(__name__)
 
+_CONTROL_WS_RE = re.compile(r"[\n\r\t]+")
+_SPACES_RE = re.compile(r" +")
+
 
 def _sanitize_text(text: str | None) -> str | None:
     """Sanitize text for TSV output - normalize whitespace, remove control chars."""
     if text is None:
         return None
     # Replace newlines, tabs, carriage returns with spaces
-    text = re.sub(r"[\n\r\t]+", " ", text)
+    text = _CONTROL_WS_RE.sub(" ", text)
     # Collapse multiple spaces
-    text = re.sub(r" +", " ", text)
+    text = _SPACES_RE.sub(" ", text)
     # Strip leading/trailing whitespace
     return text.strip() or None
 
 
+def _parse_metadata(data: dict[str, Any]) -> dict[str, str | int | None]:
+    """
+    Extract citation metadata from CSL-JSON or CrossRef works API JSON.
+
+    Args:
+        data: Work metadata (title/container-title may be strings or lists)
+
+    Returns:
+        Dictionary with title, authors, year, journal
+    """
+    metadata: dict[str, str | int | None] = {
+        "title": None,
+        "authors": None,
+        "year": None,
+        "journal": None,
+    }
+
+    # Extract title and journal (may be string or list, sanitize for TSV)
+    for key, field in (("title", "title"), ("journal", "container-title")):
+        value = data.get(field)
+        if isinstance(value, list):
+            metadata[key] = _sanitize_text(value[0]) if value else None
+        else:
+            metadata[key] = _sanitize_text(value)
+
+    # Extract authors
+    authors = data.get("author")
+    if authors:
+        metadata["authors"] = _sanitize_text(
+            "; ".join(f"{a.get('given', '')} {a.get('family', '')}".strip() for a in authors)
+        )
+
+    # Extract year (looked up without building throwaway default containers)
+    published = data.get("published")
+    date_parts = published.get("date-parts") if published else None
+    if date_parts and date_parts[0]:
+        metadata["year"] = date_parts[0][0]
+
+    return metadata
+
+
 class CrossRefDiscoverer(AbstractDiscoverer):
     """Discover citations via CrossRef Event Data API."""
 
     BASE_URL = "https://api.eventdata.crossref.org/v1/events"
     DOI_API = "https://doi.org"
+    WORKS_API = "https://api.crossref.org/works"
+    WORKS_BATCH_SIZE = 50  # DOIs per /works filter query
+    RATE_LIMIT = 50.0  # requests/second (polite pool)
+    METADATA_WORKERS = 8  # concurrent DOI metadata lookups, across all discover() calls
 
-    def __init__(self, email: str | None = None) -> None:
+    def __init__(self, email: str | None = None, cache: DOIMetadataCache | None = None) -> None:
         """
         Initialize CrossRef Event Data discoverer.
 
         Args:
             email: Email for polite pool (better rate limits)
+            cache: Cache for citing-DOI metadata (default: persisted to the file
+                named by CITATIONS_DOI_CACHE if set, otherwise in-memory)
         """
         self.email = email
+        if cache is None:
+            cache = DOIMetadataCache(os.environ.get(DOI_CACHE_ENV_VAR) or ":memory:")
+        self.cache = cache
         self.session = requests.Session()
         if email:
             self.session.headers["User-Agent"] = f"citations-collector (mailto:{email})"
@@ -54,9 +115,13 @@ class CrossRefDiscoverer(AbstractDiscoverer):
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["GET", "HEAD"],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        # Per-host limits, shared with every other discoverer and collector
+        mount_rate_limited(self.session, self.RATE_LIMIT, retry=retry_strategy, pool_maxsize=32)
+        # One pool for metadata lookups from all threads calling discover(), so
+        # they never need more doi.org connections than the session keeps
+        self._metadata_executor = ThreadPoolExecutor(
+            max_workers=self.METADATA_WORKERS, thread_name_prefix="crossref-metadata"
+        )
 
     def discover(self, item_ref: ItemRef, since: datetime | None = None) -> list[CitationRecord]:
         """
@@ -85,21 +150,78 @@ class CrossRefDiscoverer(AbstractDiscoverer):
             date_str = since.strftime("%Y-%m-%d")
             params["from-updated-date"] = date_str
 
-        try:
-            # Increase timeout to 60s - Event Data API can be slow for some queries
-            response = self.session.get(self.BASE_URL, params=params, timeout=60)
-            response.raise_for_status()
-            data = response.json()
-        except requests.Timeout:
-            logger.warning(f"CrossRef Event Data API timeout for {doi} (query took >60s)")
-            return []
-        except requests.RequestException as e:
-            logger.warning(f"CrossRef Event Data API error for {doi}: {e}")
-            return []
+        # Page through all events with the cursor; each page's citations are
+        # built (and their metadata fetched) before requesting the next
+        citations: list[CitationRecord] = []
+        n_events = 0
+        cursor: str | None = None
+        while True:
+            if cursor:
+                params["cursor"] = cursor
+            try:
+                # Increase timeout to 60s - Event Data API can be slow for some queries
+                response = self.session.get(self.BASE_URL, params=params, timeout=60)
+                response.raise_for_status()
+                data = parse_json(response)
+            except requests.Timeout:
+                logger.warning(f"CrossRef Event Data API timeout for {doi} (query took >60s)")
+                if cursor is None:
+                    return []
+                break
+            except requests.RequestException as e:
+                logger.warning(f"CrossRef Event Data API error for {doi}: {e}")
+                if cursor is None:
+                    return []
+                break
+
+            message = data.get("message", {})
+            events = message.get("events", [])
+            n_events += len(events)
+            citations.extend(self._citations_from_events(events))
+
+            next_cursor = message.get("next-cursor")
+            if not events or not next_cursor or next_cursor == cursor:
+                break
+            cursor = next_cursor
 
-        # Parse citations from events
-        citations = []
-        events = data.get("message", {}).get("events", [])
+        # Warn if Event Data returned events but they didn't yield valid citations
+        if n_events > 0 and len(citations) == 0:
+            logger.info(
+                f"CrossRef Event Data returned {n_events} events for {doi} "
+                f"but none were valid DOI-based citations (may be news/blog references)"
+            )
+
+        # Also check metadata API if we got 0 citations total
+        if len(citations) == 0:
+            try:
+                meta_resp = self.session.get(f"https://api.crossref.org/works/{doi}", timeout=10)
+                if meta_resp.status_code == 200:
+                    meta_data = parse_json(meta_resp)
+                    cited_by_count = meta_data.get("message", {}).get("is-referenced-by-count", 0)
+                    if cited_by_count > 0:
+                        logger.warning(
+                            f"CrossRef metadata shows {cited_by_count} citations for {doi}, "
+                            f"but Event Data API has 0 valid citations. "
+                            f"Full cited-by data requires CrossRef membership: "
+                            f"https://www.crossref.org/services/cited-by/"
+                        )
+            except Exception as e:
+                logger.debug(f"Failed to check cited-by count for {doi}: {e}")
+
+        return citations
+
+    def _citations_from_events(self, events: list[dict[str, Any]]) -> list[CitationRecord]:
+        """
+        Build citation records for the citing works of Event Data events.
+
+        Args:
+            events: Events from one Event Data page
+
+        Returns:
+            List of citation records (without item context)
+        """
+        # Parse citing DOIs from events
+        citing_dois = []
 
         for event in events:
             # Get the citing DOI
@@ -107,16 +229,16 @@ class CrossRefDiscoverer(AbstractDiscoverer):
             citing_doi_url = subj.get("pid", "")
 
             # Extract DOI from URL (e.g., "https://doi.org/10.1234/abc" -> "10.1234/abc")
-            citing_doi = citing_doi_url.replace("https://doi.org/", "").replace(
-                "http://doi.org/", ""
-            )
+            citing_doi = strip_doi_prefix(citing_doi_url)
 
             if not citing_doi or not citing_doi.startswith("10."):
                 continue
+            citing_dois.append(citing_doi)
 
-            # Fetch metadata for the citing DOI via DOI content negotiation
-            metadata = self._fetch_doi_metadata(citing_doi)
+        metadatas = self._fetch_doi_metadata_many(citing_dois)
 
+        citations = []
+        for citing_doi, metadata in zip(citing_dois, metadatas, strict=True):
             # Create citation record with metadata
             citation = CitationRecord(
                 item_id="",  # Will be filled by caller
@@ -132,49 +254,90 @@ class CrossRefDiscoverer(AbstractDiscoverer):
             )
             citations.append(citation)
 
-        # Warn if Event Data returned events but they didn't yield valid citations
-        if len(events) > 0 and len(citations) == 0:
-            logger.info(
-                f"CrossRef Event Data returned {len(events)} events for {doi} "
-                f"but none were valid DOI-based citations (may be news/blog references)"
-            )
+        return citations
 
-        # Also check metadata API if we got 0 citations total
-        if len(citations) == 0:
-            try:
-                meta_resp = self.session.get(f"https://api.crossref.org/works/{doi}", timeout=10)
-                if meta_resp.status_code == 200:
-                    meta_data = meta_resp.json()
-                    cited_by_count = meta_data.get("message", {}).get("is-referenced-by-count", 0)
-                    if cited_by_count > 0:
-                        logger.warning(
-                            f"CrossRef metadata shows {cited_by_count} citations for {doi}, "
-                            f"but Event Data API has 0 valid citations. "
-                            f"Full cited-by data requires CrossRef membership: "
-                            f"https://www.crossref.org/services/cited-by/"
-                        )
-            except Exception as e:
-                logger.debug(f"Failed to check cited-by count for {doi}: {e}")
+    def _fetch_doi_metadata_many(self, dois: list[str]) -> list[dict[str, str | int | None]]:
+        """
+        Fetch metadata for many DOIs, in the order given.
 
-        return citations
+        Uncached DOIs are looked up in batches via the CrossRef works API;
+        any it doesn't know (e.g. DataCite DOIs) fall back to concurrent
+        per-DOI content negotiation.
+
+        Args:
+            dois: The DOIs to fetch metadata for
+
+        Returns:
+            Dictionary with title, authors, year, journal for each DOI
+        """
+        found: dict[str, dict[str, str | int | None]] = {}
+        missing = []
+        for doi in dict.fromkeys(doi.lower() for doi in dois):
+            cached = self.cache.get(doi)
+            if cached is not None:
+                found[doi] = cast(dict[str, str | int | None], cached)
+            elif "," not in doi:  # commas would split the filter value
+                missing.append(doi)
+
+        for start in range(0, len(missing), self.WORKS_BATCH_SIZE):
+            found.update(self._fetch_works_batch(missing[start : start + self.WORKS_BATCH_SIZE]))
+
+        # The lookups are independent round trips, so overlap them
+        rest = [doi for doi in dict.fromkeys(dois) if doi.lower() not in found]
+        metadatas = self._metadata_executor.map(self._fetch_doi_metadata, rest)
+        for doi, metadata in zip(rest, metadatas, strict=True):
+            found[doi.lower()] = metadata
+
+        return [found[doi.lower()] for doi in dois]
+
+    def _fetch_works_batch(self, dois: list[str]) -> dict[str, dict[str, str | int | None]]:
+        """
+        Fetch metadata for up to WORKS_BATCH_SIZE DOIs with one works API query.
+
+        Args:
+            dois: Lowercase DOIs to fetch metadata for
+
+        Returns:
+            Metadata keyed by lowercase DOI, for the DOIs CrossRef knows
+        """
+        params: dict[str, Any] = {
+            "filter": ",".join(f"doi:{doi}" for doi in dois),
+            "rows": len(dois),
+            "select": "DOI,title,author,published,container-title",
+        }
+        try:
+            response = self.session.get(self.WORKS_API, params=params, timeout=30)
+            response.raise_for_status()
+            works = parse_json(response).get("message", {}).get("items", [])
+        except requests.RequestException as e:
+            logger.debug(f"CrossRef works batch lookup failed for {len(dois)} DOIs: {e}")
+            return {}
+
+        found = {}
+        for work in works:
+            doi = (work.get("DOI") or "").lower()
+            if doi:
+                found[doi] = metadata = _parse_metadata(work)
+                self.cache.set(doi, metadata)
+        return found
 
     def _fetch_doi_metadata(self, doi: str) -> dict[str, str | int | None]:
         """
         Fetch metadata for a DOI via content negotiation.
 
+        Successful lookups are cached; failed ones are retried on the next call.
+
         Args:
             doi: The DOI to fetch metadata for
 
         Returns:
             Dictionary with title, authors, year, journal
         """
-        metadata: dict[str, str | int | None] = {
-            "title": None,
-            "authors": None,
-            "year": None,
-            "journal": None,
-        }
+        cached = self.cache.get(doi)
+        if cached is not None:
+            return cast(dict[str, str | int | None], cached)
 
+        metadata = _parse_metadata({})
         try:
             response = self.session.get(
                 f"{self.DOI_API}/{doi}",
@@ -182,31 +345,10 @@ class CrossRefDiscoverer(AbstractDiscoverer):
                 timeout=30,
             )
             response.raise_for_status()
-            data = response.json()
-
-            # Extract title (sanitize for TSV)
-            metadata["title"] = _sanitize_text(data.get("title"))
-
-            # Extract authors
-            authors = data.get("author", [])
-            if authors:
-                author_names = [
-                    f"{a.get('given', '')} {a.get('family', '')}".strip() for a in authors
-                ]
-                metadata["authors"] = _sanitize_text("; ".join(author_names))
-
-            # Extract year
-            published = data.get("published", {})
-            date_parts = published.get("date-parts", [[]])
-            if date_parts and len(date_parts[0]) > 0:
-                metadata["year"] = date_parts[0][0]
-
-            # Extract journal (may be string or list, sanitize for TSV)
-            container = data.get("container-title")
-            if isinstance(container, list):
-                metadata["journal"] = _sanitize_text(container[0]) if container else None
-            else:
-                metadata["journal"] = _sanitize_text(container)
+            data = parse_json(response)
+
+            metadata = _parse_metadata(data)
+            self.cache.set(doi, metadata)
 
         except requests.RequestException as e:
             logger.debug(f"Failed to fetch metadata for DOI {doi}: {e}")
@@ -11,6 +11,11 @@ from typing import cast
 import requests
 
 from citations_collector.discovery.base import AbstractDiscoverer
+from citations_collector.discovery.utils import (
+    mount_rate_limited,
+    parse_json,
+    strip_doi_prefix,
+)
 from citations_collector.models import CitationRecord, CitationSource, ItemRef
 
 logger = logging.getLogger(__name__)
@@ -45,10 +50,13 @@ class DataCiteDiscoverer(AbstractDiscoverer):
     DOI_API_URL = "https://api.datacite.org/dois"
     # DOI content negotiation for metadata
     DOI_ORG = "https://doi.org"
+    RATE_LIMIT = 10.0  # requests/second
 
     def __init__(self) -> None:
         """Initialize DataCite discoverer."""
         self.session = requests.Session()
+        # Per-host limits, shared with every other discoverer and collector
+        mount_rate_limited(self.session, self.RATE_LIMIT)
 
     def discover(self, item_ref: ItemRef, since: datetime | None = None) -> list[CitationRecord]:
         """
@@ -110,7 +118,7 @@ class DataCiteDiscoverer(AbstractDiscoverer):
                 timeout=60,  # type: ignore[arg-type]
             )
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
         except requests.Timeout:
             logger.warning(f"DataCite Event Data API timeout for {doi} (query took >60s)")
             return []
@@ -129,7 +137,7 @@ class DataCiteDiscoverer(AbstractDiscoverer):
             if not subj_id:
                 continue
 
-            citing_doi = subj_id.replace("https://doi.org/", "").replace("doi:", "")
+            citing_doi = strip_doi_prefix(subj_id)
 
             # Get metadata from event or fetch via DOI
             title = _sanitize_text(subj.get("title"))
@@ -173,7 +181,7 @@ class DataCiteDiscoverer(AbstractDiscoverer):
         try:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
         except requests.RequestException as e:
             logger.debug(f"DataCite DOI API error for {doi}: {e}")
             return []
@@ -232,7 +240,7 @@ class DataCiteDiscoverer(AbstractDiscoverer):
                 timeout=30,
             )
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
 
             # Extract title (sanitize for TSV)
             metadata["title"] = _sanitize_text(data.get("title"))
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
 import time
 from datetime import datetime
 from typing import Any
@@ -11,6 +12,7 @@ from typing import Any
 import requests
 
 from citations_collector.discovery.base import AbstractDiscoverer
+from citations_collector.discovery.utils import strip_doi_prefix
 from citations_collector.models import CitationRecord, CitationSource, ItemRef
 
 logger = logging.getLogger(__name__)
@@ -53,6 +55,8 @@ class OpenAlexDiscoverer(AbstractDiscoverer):
         self.session.headers["User-Agent"] = user_agent
 
         self._last_request_time = 0.0
+        # Discovery may run queries from several threads
+        self._rate_lock = threading.Lock()
 
     def discover(self, item_ref: ItemRef, since: datetime | None = None) -> list[CitationRecord]:
         """
@@ -172,10 +176,11 @@ class OpenAlexDiscoverer(AbstractDiscoverer):
 
     def _rate_limit(self) -> None:
         """Implement rate limiting to stay under 10 req/sec."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.RATE_LIMIT_DELAY:
-            time.sleep(self.RATE_LIMIT_DELAY - elapsed)
-        self._last_request_time = time.time()
+        with self._rate_lock:
+            elapsed = time.time() - self._last_request_time
+            if elapsed < self.RATE_LIMIT_DELAY:
+                time.sleep(self.RATE_LIMIT_DELAY - elapsed)
+            self._last_request_time = time.time()
 
     def _parse_work(self, work: dict[str, Any]) -> CitationRecord | None:
         """
@@ -193,7 +198,7 @@ class OpenAlexDiscoverer(AbstractDiscoverer):
             return None
 
         # Remove https://doi.org/ prefix if present
-        doi = doi.replace("https://doi.org/", "").replace("http://doi.org/", "")
+        doi = strip_doi_prefix(doi)
 
         if not doi.startswith("10."):
             return None
@@ -10,6 +10,7 @@ from typing import cast
 import requests
 
 from citations_collector.discovery.base import AbstractDiscoverer
+from citations_collector.discovery.utils import mount_rate_limited
 from citations_collector.models import CitationRecord, CitationSource, ItemRef
 
 logger = logging.getLogger(__name__)
@@ -32,10 +33,13 @@ class OpenCitationsDiscoverer(AbstractDiscoverer):
 
     BASE_URL = "https://opencitations.net/index/coci/api/v1/citations"
     DOI_API = "https://doi.org"
+    RATE_LIMIT = 5.0  # requests/second
 
     def __init__(self) -> None:
         """Initialize OpenCitations discoverer."""
         self.session = requests.Session()
+        # Per-host limits, shared with every other discoverer and collector
+        mount_rate_limited(self.session, self.RATE_LIMIT)
 
     def discover(self, item_ref: ItemRef, since: datetime | None = None) -> list[CitationRecord]:
         """
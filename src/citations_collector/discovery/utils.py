@@ -2,8 +2,306 @@
 
 from __future__ import annotations
 
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3.util.retry import Retry
+
 from citations_collector.models import CitationRecord
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Set to a file path to persist DOI metadata lookups across runs (SQLite)
+DOI_CACHE_ENV_VAR = "CITATIONS_DOI_CACHE"
+
+# Resolver URL or "doi:" prefix in front of a bare DOI
+_DOI_PREFIX_RE = re.compile(r"^(?:https?://(?:dx\.)?doi\.org/|doi:)", re.IGNORECASE)
+
+# X-Rate-Limit-Interval values such as "1s" or "5m"
+_INTERVAL_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([smh]?)\s*$")
+_INTERVAL_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600}
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting how often requests are sent.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``; each
+    request takes one token, waiting for it if the bucket is empty. The rate
+    can be lowered at runtime (e.g. from server rate-limit headers) but never
+    raised above ``max_rate``, initially the rate it was created with.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """
+        Initialize rate limiter.
+
+        Args:
+            rate: Sustained requests per second
+            burst: Maximum number of requests that may be sent back-to-back
+        """
+        self.rate = rate
+        self.max_rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            # Reserve the token now and sleep off the debt outside the lock,
+            # so waiting threads queue up in order without holding it
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+    def set_rate(self, rate: float) -> None:
+        """Change the sustained rate, capped at max_rate."""
+        rate = min(rate, self.max_rate)
+        if rate > 0 and rate != self.rate:
+            with self._lock:
+                self.rate = rate
+
+    def lower_max_rate(self, rate: float) -> None:
+        """Lower the rate ceiling (and the current rate if above it)."""
+        with self._lock:
+            if rate < self.max_rate:
+                self.max_rate = rate
+                self.rate = min(self.rate, rate)
+
+
+# Token buckets shared by all rate-limited sessions, keyed by host (netloc)
+_host_limiters: dict[str, RateLimiter] = {}
+_host_limiters_lock = threading.Lock()
+
+
+def host_rate_limiter(host: str, rate: float, burst: int = 1) -> RateLimiter:
+    """
+    Return the RateLimiter shared by every session sending requests to host.
+
+    Sessions configured with different rates for the same host (e.g. doi.org,
+    queried by several discoverers) share the lowest of them.
+
+    Args:
+        host: Host (netloc) requests are sent to, e.g. "api.crossref.org"
+        rate: Sustained requests per second the caller allows for host
+        burst: Maximum number of requests that may be sent back-to-back
+
+    Returns:
+        The limiter for host
+    """
+    with _host_limiters_lock:
+        limiter = _host_limiters.get(host)
+        if limiter is None:
+            limiter = _host_limiters[host] = RateLimiter(rate, burst)
+    if rate < limiter.max_rate:
+        limiter.lower_max_rate(rate)
+    return limiter
+
+
+def advertised_rate(headers: Any) -> float | None:
+    """
+    Parse the request rate a server advertises in its response headers.
+
+    CrossRef sends ``X-Rate-Limit-Limit`` (requests) and
+    ``X-Rate-Limit-Interval`` (e.g. "1s") on every response.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Allowed requests per second, or None if not advertised
+    """
+    limit = headers.get("X-Rate-Limit-Limit")
+    interval = headers.get("X-Rate-Limit-Interval")
+    if not limit or not interval:
+        return None
+    match = _INTERVAL_RE.match(interval)
+    if match is None:
+        return None
+    try:
+        requests_allowed = float(limit)
+    except ValueError:
+        return None
+    seconds = float(match.group(1)) * _INTERVAL_UNITS[match.group(2)]
+    return requests_allowed / seconds if seconds > 0 else None
+
+
+class DOIMetadataCache:
+    """
+    Thread-safe DOI -> metadata cache backed by SQLite.
+
+    The default in-memory database only avoids refetching a DOI within a run;
+    given a file path, entries persist across runs until they are older than
+    ``ttl_days``. The file may be shared by concurrent processes; database
+    errors (e.g. "database is locked") are treated as a miss or a skipped
+    write, never as a failed lookup.
+    """
+
+    BUSY_TIMEOUT = 10.0  # seconds to wait for another writer's lock
+
+    def __init__(self, path: Path | str = ":memory:", ttl_days: float = 60) -> None:
+        """
+        Initialize DOI metadata cache.
+
+        Args:
+            path: SQLite database file, or ":memory:" for a per-process cache
+            ttl_days: Age after which cached metadata is refetched
+        """
+        self.ttl = ttl_days * 86400
+        self._lock = threading.Lock()
+        try:
+            self._conn = self._connect(str(path))
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"DOI metadata cache {path} unavailable, caching in memory: {e}")
+            self._conn = self._connect(":memory:")
+
+    def _connect(self, path: str) -> sqlite3.Connection:
+        """Open the cache database and create its table."""
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            path, timeout=self.BUSY_TIMEOUT, check_same_thread=False, isolation_level=None
+        )
+        if path != ":memory:":
+            # Readers don't block on (and aren't blocked by) another process writing
+            conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS doi_metadata "
+            "(doi TEXT PRIMARY KEY, metadata TEXT NOT NULL, fetched REAL NOT NULL)"
+        )
+        return conn
+
+    def get(self, doi: str) -> dict[str, Any] | None:
+        """Return cached metadata for doi, or None if missing, expired or unreadable."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT metadata FROM doi_metadata WHERE doi = ? AND fetched >= ?",
+                    (doi.lower(), time.time() - self.ttl),
+                ).fetchone()
+            return json.loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError) as e:
+            logger.debug(f"DOI metadata cache read failed for {doi}: {e}")
+            return None
+
+    def set(self, doi: str, metadata: dict[str, Any]) -> None:
+        """Store metadata for doi; skipped if the database can't be written."""
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO doi_metadata VALUES (?, ?, ?)",
+                    (doi.lower(), json.dumps(metadata), time.time()),
+                )
+        except sqlite3.Error as e:
+            logger.debug(f"DOI metadata cache write failed for {doi}: {e}")
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that takes a token from the target host's RateLimiter before each request."""
+
+    def __init__(self, rate: float, burst: int = 1, **kwargs: Any) -> None:
+        self.rate = rate
+        self.burst = burst
+        super().__init__(**kwargs)
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        """Send request once its host's rate limiter allows it, adapting to advertised limits."""
+        limiter = host_rate_limiter(urlparse(request.url or "").netloc, self.rate, self.burst)
+        limiter.acquire()
+        response = super().send(request, **kwargs)
+        rate = advertised_rate(response.headers)
+        if rate is not None:
+            limiter.set_rate(rate)
+        return response
+
+
+def mount_rate_limited(
+    session: requests.Session,
+    rate: float,
+    burst: int = 1,
+    retry: Retry | None = None,
+    pool_maxsize: int = DEFAULT_POOLSIZE,
+) -> None:
+    """
+    Rate limit all requests sent through session.
+
+    Limits are per host and shared with every other rate-limited session in
+    the process (see host_rate_limiter), so concurrent collectors and
+    discoverers querying the same host stay within one budget.
+
+    Unless a retry strategy is given, requests rejected with 429/503 are
+    retried with exponential backoff, honoring the Retry-After header.
+    Connection errors and timeouts are not retried and raise as they would
+    without the adapter, so a caller's timeout stays an upper bound.
+
+    Args:
+        session: Session to mount the rate-limited adapter on
+        rate: Sustained requests per second to each host
+        burst: Maximum number of requests that may be sent back-to-back
+        retry: Optional urllib3 retry strategy
+        pool_maxsize: Connections kept alive per host; raise it for
+            sessions shared by many threads
+    """
+    if retry is None:
+        retry = Retry(
+            total=None,
+            connect=0,
+            read=False,  # re-raise read timeouts as requests.Timeout
+            other=0,
+            status=5,
+            backoff_factor=1,  # 1s, 2s, 4s, 8s
+            status_forcelist=[429, 503],
+            allowed_methods=["GET", "HEAD"],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+    adapter = RateLimitedAdapter(rate, burst, max_retries=retry, pool_maxsize=pool_maxsize)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+
+def parse_json(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body, using orjson when it is installed.
+
+    Large Event Data/DataCite pages decode several times faster with orjson.
+    Invalid JSON raises requests' JSONDecodeError either way, so callers
+    handling requests.RequestException are unaffected.
+
+    Args:
+        response: Response with a JSON body
+
+    Returns:
+        Decoded JSON
+    """
+    if orjson is None:
+        return response.json()
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
 
 def build_doi_url(doi: str) -> str:
     """
@@ -18,6 +316,19 @@ def build_doi_url(doi: str) -> str:
     return f"https://doi.org/{doi}"
 
 
+def strip_doi_prefix(doi: str) -> str:
+    """
+    Strip a leading resolver URL or "doi:" prefix from a DOI.
+
+    Args:
+        doi: DOI, possibly as https://doi.org/..., http://dx.doi.org/... or doi:...
+
+    Returns:
+        Bare DOI (e.g. "10.1234/abc")
+    """
+    return _DOI_PREFIX_RE.sub("", doi, count=1)
+
+
 def deduplicate_citations(citations: list[CitationRecord]) -> list[CitationRecord]:
     """
     Deduplicate citations by unique key (item_id, item_flavor, citation_doi).
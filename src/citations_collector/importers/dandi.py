@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import contextlib
 import logging
-from collections.abc import Callable, Iterator
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date
-from typing import Any
+from typing import Any, TypeVar
 
 import requests
 
@@ -14,6 +16,9 @@ from citations_collector.models import Collection, Item, ItemFlavor, ItemRef, Re
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 class DANDIImporter:
     """
@@ -29,6 +34,7 @@ class DANDIImporter:
 
     BASE_URL = "https://api.dandiarchive.org/api"
     PAGE_SIZE = 100  # DANDI API default
+    CONCURRENCY = 8  # Dandisets whose versions are fetched in parallel
 
     def __init__(self, api_url: str | None = None) -> None:
         """
@@ -48,6 +54,7 @@ class DANDIImporter:
         dandiset_ids: list[str],
         include_draft: bool = False,
         progress_callback: Callable[[int, int | None], None] | None = None,
+        concurrency: int = CONCURRENCY,
     ) -> Collection:
         """
         Import specific dandisets by their identifiers.
@@ -56,6 +63,7 @@ class DANDIImporter:
             dandiset_ids: List of dandiset identifiers (e.g., ["000003", "000402"])
             include_draft: If True, include draft versions without DOIs.
             progress_callback: Optional callback(current, total) for progress updates.
+            concurrency: Number of dandisets fetched in parallel.
 
         Returns:
             Collection with the specified dandisets and their versions.
@@ -63,14 +71,20 @@ class DANDIImporter:
         items: list[Item] = []
         total = len(dandiset_ids)
 
-        for idx, dandiset_id in enumerate(dandiset_ids):
-            # Fetch dandiset metadata
+        def fetch(dandiset_id: str) -> tuple[dict | None, Item | None]:
             dandiset = self._fetch_dandiset(dandiset_id)
+            if dandiset is None:
+                return None, None
+            return dandiset, self._dandiset_to_item(dandiset, include_draft=include_draft)
+
+        results = self._map_ordered(fetch, dandiset_ids, concurrency)
+        for idx, (dandiset_id, (dandiset, item)) in enumerate(
+            zip(dandiset_ids, results, strict=True)
+        ):
             if dandiset is None:
                 logger.warning(f"Dandiset {dandiset_id} not found, skipping")
                 continue
 
-            item = self._dandiset_to_item(dandiset, include_draft=include_draft)
             if item is not None and item.flavors:
                 items.append(item)
                 logger.debug(f"Imported dandiset {item.item_id} with {len(item.flavors)} versions")
@@ -93,6 +107,7 @@ class DANDIImporter:
         include_draft: bool = False,
         limit: int | None = None,
         progress_callback: Callable[[int, int | None], None] | None = None,
+        concurrency: int = CONCURRENCY,
     ) -> Collection:
         """
         Import all dandisets as a Collection.
@@ -102,6 +117,7 @@ class DANDIImporter:
                           Default False (only published versions with DOIs).
             limit: Optional limit on number of dandisets to import.
             progress_callback: Optional callback(current, total) for progress updates.
+            concurrency: Number of dandisets whose versions are fetched in parallel.
 
         Returns:
             Collection with:
@@ -112,19 +128,27 @@ class DANDIImporter:
         items: list[Item] = []
         count = 0
 
-        for dandiset in self._iter_dandisets():
-            if limit is not None and count >= limit:
-                break
+        results = self._map_ordered(
+            lambda dandiset: self._dandiset_to_item(dandiset, include_draft=include_draft),
+            self._iter_dandisets(),
+            concurrency,
+        )
+        # closing() cancels outstanding fetches as soon as the limit is reached
+        with contextlib.closing(results):
+            for item in results:
+                if limit is not None and count >= limit:
+                    break
 
-            item = self._dandiset_to_item(dandiset, include_draft=include_draft)
-            if item is not None and item.flavors:  # Only include if has versions
-                items.append(item)
-                count += 1
+                if item is not None and item.flavors:  # Only include if has versions
+                    items.append(item)
+                    count += 1
 
-                if progress_callback:
-                    progress_callback(count, limit)
+                    if progress_callback:
+                        progress_callback(count, limit)
 
-                logger.debug(f"Imported dandiset {item.item_id} with {len(item.flavors)} versions")
+                    logger.debug(
+                        f"Imported dandiset {item.item_id} with {len(item.flavors)} versions"
+                    )
 
         logger.info(f"Imported {len(items)} dandisets from DANDI Archive")
 
@@ -136,6 +160,29 @@ class DANDIImporter:
             items=items,
         )
 
+    @staticmethod
+    def _map_ordered(
+        fn: Callable[[T], R], inputs: Iterable[T], concurrency: int
+    ) -> Generator[R, None, None]:
+        """
+        Lazily map fn over inputs on a thread pool, yielding results in input order.
+
+        At most ``concurrency`` calls are in flight, so a consumer that stops
+        early (e.g. on reaching a limit) doesn't trigger fetching everything.
+        """
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            pending: deque[Future[R]] = deque()
+            try:
+                for value in inputs:
+                    pending.append(executor.submit(fn, value))
+                    if len(pending) >= concurrency:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
     def _fetch_dandiset(self, dandiset_id: str) -> dict | None:
         """
         Fetch a single dandiset by ID.
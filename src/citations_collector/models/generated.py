@@ -51,14 +51,20 @@ class ConfiguredBaseModel(BaseModel):
     def treat_empty_lists_as_none(
             self, handler: SerializerFunctionWrapHandler,
             info: SerializationInfo) -> dict[str, Any]:
+        # NOTE: Manually adjusted from the LinkML template: only copy when
+        # there are empty lists to drop, and write them via __dict__ so that
+        # validate_assignment doesn't revalidate the model for every field.
+        # Preserve when regenerating models from schema.
+        _instance = self
         if info.exclude_none:
-            _instance = self.model_copy()
-            for field, field_info in type(_instance).model_fields.items():
-                if getattr(_instance, field) == [] and not(
-                        field_info.is_required()):
-                    setattr(_instance, field, None)
-        else:
-            _instance = self
+            empty_fields = [
+                field for field, field_info in type(self).model_fields.items()
+                if getattr(self, field) == [] and not field_info.is_required()
+            ]
+            if empty_fields:
+                _instance = self.model_copy()
+                for field in empty_fields:
+                    _instance.__dict__[field] = None
         return handler(_instance, info)
 
 
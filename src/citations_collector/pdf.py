@@ -150,14 +150,20 @@ class PDFAcquirer:
         counts = {"downloaded": 0, "skipped": 0, "no_oa": 0, "no_doi": 0, "error": 0}
         seen_dois: set[str] = set()
 
+        # Index citations by DOI once so duplicates don't rescan the whole list
+        by_doi: dict[str, list[CitationRecord]] = {}
+        for citation in citations:
+            if citation.citation_doi:
+                by_doi.setdefault(citation.citation_doi, []).append(citation)
+
         for citation in citations:
             if not citation.citation_doi:
                 counts["no_doi"] += 1
                 continue
             if citation.citation_doi in seen_dois:
                 # Copy fields from first citation with same DOI
-                for prev in citations:
-                    if prev.citation_doi == citation.citation_doi and prev.oa_status:
+                for prev in by_doi[citation.citation_doi]:
+                    if prev.oa_status:
                         citation.oa_status = prev.oa_status
                         citation.pdf_url = prev.pdf_url
                         citation.pdf_path = prev.pdf_path
@@ -3,11 +3,20 @@
 from __future__ import annotations
 
 import csv
+import logging
+import os
+import pickle
 from contextlib import suppress
 from pathlib import Path
+from typing import IO
 
 from citations_collector.models import CitationRecord
 
+logger = logging.getLogger(__name__)
+
+# Set to "1" to cache parsed citations in a pickle sidecar next to the TSV
+CACHE_ENV_VAR = "CITATIONS_TSV_CACHE"
+
 # TSV column order matching examples/citations-example.tsv
 TSV_COLUMNS = [
     "item_id",
@@ -42,6 +51,10 @@ def load_citations(path: Path) -> list[CitationRecord]:
     """
     Load citations from TSV file.
 
+    If the CITATIONS_TSV_CACHE environment variable is set to "1", parsed
+    citations are cached in a ``<name>.pickle`` sidecar keyed by the TSV's
+    mtime and size, so unchanged files skip parsing and validation.
+
     Args:
         path: Path to TSV file
 
@@ -51,6 +64,38 @@ def load_citations(path: Path) -> list[CitationRecord]:
     Raises:
         FileNotFoundError: If file doesn't exist
     """
+    if os.environ.get(CACHE_ENV_VAR) == "1":
+        return _load_citations_cached(path)
+    return _parse_citations(path)
+
+
+def _load_citations_cached(path: Path) -> list[CitationRecord]:
+    """Load citations via the pickle sidecar, refreshing it when stale."""
+    stat = path.stat()
+    # Model fields are part of the key so schema changes invalidate the cache
+    signature = (stat.st_mtime_ns, stat.st_size, tuple(CitationRecord.model_fields))
+    cache_path = path.with_name(f"{path.name}.pickle")
+
+    if cache_path.exists():
+        try:
+            with open(cache_path, "rb") as f:
+                cached_signature, citations = pickle.load(f)
+            if cached_signature == signature:
+                return citations  # type: ignore[no-any-return]
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable TSV cache {cache_path}: {e}")
+
+    citations = _parse_citations(path)
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump((signature, citations), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        logger.debug(f"Failed to write TSV cache {cache_path}: {e}")
+    return citations
+
+
+def _parse_citations(path: Path) -> list[CitationRecord]:
+    """Parse and validate citations from a TSV file."""
     citations = []
 
     with open(path, newline="") as f:
@@ -113,53 +158,70 @@ def save_citations(citations: list[CitationRecord], path: Path) -> None:
     """
     Save citations to TSV file.
 
+    The file is written to a temporary sibling and atomically renamed over
+    path, so a crash mid-write never leaves a truncated TSV behind and
+    readers never observe a partially written one.
+
     Args:
         citations: List of CitationRecord objects
         path: Path to output TSV file
     """
-    with open(path, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=TSV_COLUMNS, delimiter="\t", extrasaction="ignore")
-        writer.writeheader()
-
-        for citation in citations:
-            # Convert to dict
-            data = citation.model_dump(exclude_none=False, mode="python")
-
-            # Serialize citation_sources list to comma-separated string
-            if "citation_sources" in data:
-                if data["citation_sources"]:
-                    data["citation_sources"] = ", ".join(data["citation_sources"])
-                else:
-                    # Empty list -> empty string (not "[]")
-                    data["citation_sources"] = ""
-
-            # Serialize citation_relationships list to comma-separated string
-            if "citation_relationships" in data:
-                if data["citation_relationships"]:
-                    # Convert enum values to strings
-                    data["citation_relationships"] = ", ".join(
-                        str(r) for r in data["citation_relationships"]
-                    )
-                else:
-                    # Empty list -> empty string (not "[]")
-                    data["citation_relationships"] = ""
-
-            # Remove deprecated singular fields from output
-            if "citation_source" in data:
-                del data["citation_source"]
-            if "citation_relationship" in data:
-                del data["citation_relationship"]
-
-            # Convert None to empty string for TSV
-            # Also handle empty lists that weren't already converted
-            cleaned = {}
-            for k, v in data.items():
-                if v is None:
-                    cleaned[k] = ""
-                elif isinstance(v, list):
-                    # Should not happen after above processing, but be safe
-                    cleaned[k] = ", ".join(str(x) for x in v) if v else ""
-                else:
-                    cleaned[k] = str(v)
-
-            writer.writerow(cleaned)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        with open(tmp_path, "w", newline="") as f:
+            _write_citations(citations, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _write_citations(citations: list[CitationRecord], f: IO[str]) -> None:
+    """Write citations as TSV rows to an open text file."""
+    writer = csv.DictWriter(f, fieldnames=TSV_COLUMNS, delimiter="\t", extrasaction="ignore")
+    writer.writeheader()
+
+    for citation in citations:
+        # Convert to dict
+        data = citation.model_dump(exclude_none=False, mode="python")
+
+        # Serialize citation_sources list to comma-separated string
+        if "citation_sources" in data:
+            if data["citation_sources"]:
+                data["citation_sources"] = ", ".join(data["citation_sources"])
+            else:
+                # Empty list -> empty string (not "[]")
+                data["citation_sources"] = ""
+
+        # Serialize citation_relationships list to comma-separated string
+        if "citation_relationships" in data:
+            if data["citation_relationships"]:
+                # Convert enum values to strings
+                data["citation_relationships"] = ", ".join(
+                    str(r) for r in data["citation_relationships"]
+                )
+            else:
+                # Empty list -> empty string (not "[]")
+                data["citation_relationships"] = ""
+
+        # Remove deprecated singular fields from output
+        if "citation_source" in data:
+            del data["citation_source"]
+        if "citation_relationship" in data:
+            del data["citation_relationship"]
+
+        # Convert None to empty string for TSV
+        # Also handle empty lists that weren't already converted
+        cleaned = {}
+        for k, v in data.items():
+            if v is None:
+                cleaned[k] = ""
+            elif isinstance(v, list):
+                # Should not happen after above processing, but be safe
+                cleaned[k] = ", ".join(str(x) for x in v) if v else ""
+            else:
+                cleaned[k] = str(v)
+
+        writer.writerow(cleaned)
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
+from typing import Any
 
 import yaml
 
 from citations_collector.models import Collection
 
+# libyaml's C loader parses ~10x faster; fall back to pure Python without it
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_collection(path: Path) -> Collection:
     """
@@ -23,12 +28,20 @@ def load_collection(path: Path) -> Collection:
         FileNotFoundError: If file doesn't exist
         ValidationError: If YAML doesn't match schema
     """
-    with open(path) as f:
-        data = yaml.safe_load(f)
+    stat = Path(path).stat()
+    data = _parse_yaml(str(path), stat.st_mtime_ns, stat.st_size)
 
+    # Validation builds fresh objects, so callers never share the cached data
     return Collection(**data)
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse YAML file, cached by path and stat signature (which invalidates on change)."""
+    with open(path) as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
 def save_collection(collection: Collection, path: Path) -> None:
     """
     Save collection to YAML file.
@@ -48,3 +61,4 @@ def save_collection(collection: Collection, path: Path) -> None:
             sort_keys=False,
             allow_unicode=True,
         )
+    _parse_yaml.cache_clear()
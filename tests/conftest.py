@@ -6,6 +6,8 @@ from pathlib import Path
 
 import pytest
 
+from citations_collector.discovery import utils
+
 
 @pytest.fixture
 def fixtures_dir() -> Path:
@@ -29,3 +31,9 @@ def tsv_dir(fixtures_dir: Path) -> Path:
 def responses_dir(fixtures_dir: Path) -> Path:
     """Return path to mock API response fixtures."""
     return fixtures_dir / "responses"
+
+
+@pytest.fixture(autouse=True)
+def _isolate_host_rate_limiters(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give each test its own per-host rate limiters."""
+    monkeypatch.setattr(utils, "_host_limiters", {})
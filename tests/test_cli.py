@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import shutil
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -20,6 +22,17 @@ def _copy_fixture(collections_dir: Path, tmp_path: Path) -> Path:
     return dst
 
 
+@pytest.mark.ai_generated
+def test_cli_import_is_lightweight() -> None:
+    """Importing the CLI must not load models, HTTP or YAML libraries up front."""
+    heavy = ["requests", "pydantic", "yaml", "citations_collector.core"]
+    code = f"import sys, citations_collector.cli; print([m for m in {heavy!r} if m in sys.modules])"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
 @pytest.mark.ai_generated
 @responses.activate
 def test_discover_command(collections_dir: Path, tmp_path: Path) -> None:
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import logging
+import time
 from pathlib import Path
 
 import pytest
 import responses
 
+from citations_collector import core
 from citations_collector.core import CitationCollector
+from citations_collector.discovery import CrossRefDiscoverer
+from citations_collector.importers import GitHubMapper, ZenodoExpander
+from citations_collector.models import CitationRecord, Collection, ItemRef
 
 
 @pytest.mark.ai_generated
@@ -68,6 +74,151 @@ def test_discover_all_with_mocks(collections_dir: Path) -> None:
     assert collector.citations[0].item_flavor == "1.0.0"
 
 
+@pytest.mark.ai_generated
+def test_discover_all_concurrent_keeps_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test concurrent discovery returns citations in collection order."""
+
+    def fake_discover(self: object, ref: object, since: object = None) -> list[CitationRecord]:
+        # Earlier refs take longer, so queries complete out of submission order
+        i = int(ref.ref_value.rsplit("/", 1)[1])  # type: ignore[attr-defined]
+        time.sleep((20 - i) * 0.001)
+        return [
+            CitationRecord(
+                item_id="placeholder",
+                item_flavor="placeholder",
+                citation_doi=f"{ref.ref_value}.citing",  # type: ignore[attr-defined]
+                citation_relationship="Cites",
+                citation_source="crossref",
+            )
+        ]
+
+    monkeypatch.setattr(CrossRefDiscoverer, "discover", fake_discover)
+
+    collection = Collection.model_validate(
+        {
+            "name": "Many",
+            "items": [
+                {
+                    "item_id": f"item-{i}",
+                    "flavors": [
+                        {"flavor_id": "1", "refs": [{"ref_type": "doi", "ref_value": f"10.1/{i}"}]}
+                    ],
+                }
+                for i in range(20)
+            ],
+        }
+    )
+    collector = CitationCollector(collection)
+    collector.discover_all(sources=["crossref"], concurrency={"crossref": 8})
+
+    assert [c.item_id for c in collector.citations] == [f"item-{i}" for i in range(20)]
+    assert [c.citation_doi for c in collector.citations] == [f"10.1/{i}.citing" for i in range(20)]
+
+
+@pytest.mark.ai_generated
+def test_discover_all_without_progress(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], collections_dir: Path
+) -> None:
+    """Test progress=False draws no bar and leaves the root logger's handlers alone."""
+
+    def no_redirect() -> None:
+        raise AssertionError("logging_redirect_tqdm() must not be used")
+
+    monkeypatch.setattr(core, "logging_redirect_tqdm", no_redirect)
+    monkeypatch.setattr(CrossRefDiscoverer, "discover", lambda self, ref, since=None: [])
+    handlers = list(logging.root.handlers)
+
+    collector = CitationCollector.from_yaml(collections_dir / "simple.yaml")
+    collector.discover_all(sources=["crossref"], progress=False)
+
+    assert logging.root.handlers == handlers
+    assert "Discovering citations" not in capsys.readouterr().err
+
+
+@pytest.mark.ai_generated
+def test_discover_all_skips_unsupported_refs(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test refs are only dispatched to discoverers supporting their type."""
+    queried: list[str] = []
+
+    def fake_discover(self: object, ref: object, since: object = None) -> list[CitationRecord]:
+        queried.append(ref.ref_type)  # type: ignore[attr-defined]
+        return []
+
+    monkeypatch.setattr(CrossRefDiscoverer, "discover", fake_discover)
+
+    collection = Collection.model_validate(
+        {
+            "name": "Mixed",
+            "items": [
+                {
+                    "item_id": "tool",
+                    "flavors": [
+                        {
+                            "flavor_id": "latest",
+                            "refs": [
+                                {"ref_type": "github", "ref_value": "org/tool"},
+                                {"ref_type": "doi", "ref_value": "10.1/tool"},
+                            ],
+                        }
+                    ],
+                }
+            ],
+        }
+    )
+    CitationCollector(collection).discover_all(sources=["crossref"])
+
+    assert queried == ["doi"]
+
+
+@pytest.mark.ai_generated
+def test_expand_refs_concurrent(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test expanded refs are appended in order and deduplicated per flavor."""
+
+    # Earlier items take longer, so lookups complete out of submission order
+    def fake_expand(self: object, concept_id: str) -> list[ItemRef]:
+        time.sleep((6 - int(concept_id)) * 0.002)
+        return [
+            ItemRef(ref_type="doi", ref_value=f"10.5281/zenodo.{concept_id}"),
+            ItemRef(ref_type="doi", ref_value=f"10.5281/zenodo.{concept_id}1"),
+        ]
+
+    def fake_map(self: object, repo: str) -> ItemRef | None:
+        time.sleep((6 - int(repo.removeprefix("org/repo"))) * 0.002)
+        return ItemRef(ref_type="doi", ref_value="10.5281/zenodo.11") if repo else None
+
+    monkeypatch.setattr(ZenodoExpander, "expand", fake_expand)
+    monkeypatch.setattr(GitHubMapper, "map_to_doi", fake_map)
+
+    collection = Collection.model_validate(
+        {
+            "name": "Expand",
+            "items": [
+                {
+                    "item_id": f"item-{i}",
+                    "flavors": [
+                        {
+                            "flavor_id": "latest",
+                            "refs": [
+                                {"ref_type": "zenodo_concept", "ref_value": str(i)},
+                                {"ref_type": "github", "ref_value": f"org/repo{i}"},
+                            ],
+                        }
+                    ],
+                }
+                for i in range(1, 6)
+            ],
+        }
+    )
+    CitationCollector(collection).expand_refs(concurrency=4)
+
+    for i, item in enumerate(collection.items, 1):
+        values = [ref.ref_value for ref in item.flavors[0].refs]
+        expected = [str(i), f"org/repo{i}", f"10.5281/zenodo.{i}", f"10.5281/zenodo.{i}1"]
+        if i != 1:  # the GitHub DOI duplicates item-1's second Zenodo version
+            expected.append("10.5281/zenodo.11")
+        assert values == expected
+
+
 @pytest.mark.ai_generated
 def test_load_existing_citations(tsv_dir: Path, collections_dir: Path) -> None:
     """Test loading existing citations from TSV."""
@@ -81,8 +232,6 @@ def test_load_existing_citations(tsv_dir: Path, collections_dir: Path) -> None:
 @pytest.mark.ai_generated
 def test_merge_citations_preserve_curation(collections_dir: Path) -> None:
     """Test merging new citations preserves existing curation."""
-    from citations_collector.models import CitationRecord
-
     collector = CitationCollector.from_yaml(collections_dir / "simple.yaml")
 
     # Add existing citation with curation
@@ -117,11 +266,48 @@ def test_merge_citations_preserve_curation(collections_dir: Path) -> None:
     assert collector.citations[0].citation_comment == "False positive"
 
 
+@pytest.mark.ai_generated
+def test_merge_citations_repeated(collections_dir: Path) -> None:
+    """Test repeated merges dedupe against earlier merges and edited citation lists."""
+
+    def record(doi: str, title: str | None = None) -> CitationRecord:
+        return CitationRecord(
+            item_id="test-item",
+            item_flavor="1.0.0",
+            citation_doi=doi,
+            citation_title=title,
+            citation_relationship="Cites",
+            citation_source="crossref",
+            citation_status="active",
+        )
+
+    collector = CitationCollector.from_yaml(collections_dir / "simple.yaml")
+    collector.merge_citations([record("10.1/a")])
+    collector.merge_citations([record("10.1/a", "Title A"), record("10.1/b")])
+    assert [c.citation_doi for c in collector.citations] == ["10.1/a", "10.1/b"]
+    assert collector.citations[0].citation_title == "Title A"
+
+    # Replacing the list directly is picked up by the next merge
+    collector.citations = [record("10.1/c")]
+    collector.merge_citations([record("10.1/a"), record("10.1/c", "Title C")])
+    assert [c.citation_doi for c in collector.citations] == ["10.1/c", "10.1/a"]
+    assert collector.citations[0].citation_title == "Title C"
+
+    # Same-length edits to the public list are picked up too
+    collector.citations[0] = record("10.1/b")
+    collector.merge_citations([record("10.1/b", "Title B")])
+    assert [c.citation_doi for c in collector.citations] == ["10.1/b", "10.1/a"]
+    assert collector.citations[0].citation_title == "Title B"
+
+    collector.citations.pop()
+    collector.citations.append(record("10.1/z"))
+    collector.merge_citations([record("10.1/a")])
+    assert [c.citation_doi for c in collector.citations] == ["10.1/b", "10.1/z", "10.1/a"]
+
+
 @pytest.mark.ai_generated
 def test_save_workflow(tmp_path: Path, collections_dir: Path) -> None:
     """Test saving collection and citations."""
-    from citations_collector.models import CitationRecord
-
     collector = CitationCollector.from_yaml(collections_dir / "simple.yaml")
 
     # Add a citation
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import json
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 import pytest
+import requests
 import responses
 
 from citations_collector.discovery import (
@@ -14,7 +19,7 @@ from citations_collector.discovery import (
     DataCiteDiscoverer,
     OpenCitationsDiscoverer,
 )
-from citations_collector.discovery.utils import deduplicate_citations
+from citations_collector.discovery.utils import deduplicate_citations, host_rate_limiter
 from citations_collector.models import ItemRef
 
 
@@ -121,6 +126,185 @@ def test_crossref_network_error() -> None:
     assert citations == []
 
 
+@pytest.mark.ai_generated
+@responses.activate
+def test_crossref_paginates_events() -> None:
+    """Test Event Data results are followed across pages via next-cursor."""
+    from responses import matchers
+
+    def page(dois: list[str], next_cursor: str | None) -> dict:
+        events = [{"subj": {"pid": f"https://doi.org/{doi}"}} for doi in dois]
+        return {"message": {"events": events, "next-cursor": next_cursor}}
+
+    url = "https://api.eventdata.crossref.org/v1/events"
+    responses.add(
+        responses.GET,
+        url,
+        match=[matchers.query_param_matcher({"cursor": "page-2"}, strict_match=False)],
+        json=page(["10.1234/c"], "page-2"),  # repeated cursor ends pagination
+    )
+    responses.add(responses.GET, url, json=page(["10.1234/a", "10.1234/b"], "page-2"))
+    for doi in ("10.1234/a", "10.1234/b", "10.1234/c"):
+        responses.add(responses.GET, f"https://doi.org/{doi}", json={"title": doi})
+
+    discoverer = CrossRefDiscoverer()
+    citations = discoverer.discover(ItemRef(ref_type="doi", ref_value="10.1234/test.dataset"))
+
+    assert [c.citation_doi for c in citations] == ["10.1234/a", "10.1234/b", "10.1234/c"]
+    event_calls = [call for call in responses.calls if call.request.url.startswith(url)]
+    assert len(event_calls) == 2
+
+
+@pytest.mark.ai_generated
+@responses.activate
+def test_crossref_batched_metadata(responses_dir: Path) -> None:
+    """Test citing-DOI metadata comes from one works query, with per-DOI fallback."""
+    from responses import matchers
+
+    with open(responses_dir / "crossref_success.json") as f:
+        mock_data = json.load(f)
+    responses.add(responses.GET, "https://api.eventdata.crossref.org/v1/events", json=mock_data)
+
+    # CrossRef knows only the first citing DOI
+    responses.add(
+        responses.GET,
+        "https://api.crossref.org/works",
+        match=[
+            matchers.query_param_matcher(
+                {"filter": "doi:10.1234/citing.paper1,doi:10.1234/citing.paper2"},
+                strict_match=False,
+            )
+        ],
+        json={
+            "message": {
+                "items": [
+                    {
+                        "DOI": "10.1234/CITING.PAPER1",
+                        "title": ["First paper\nciting our dataset"],
+                        "author": [{"given": "John", "family": "Smith"}],
+                        "published": {"date-parts": [[2024, 1, 15]]},
+                        "container-title": ["Journal of Test Research"],
+                    }
+                ]
+            }
+        },
+    )
+    responses.add(
+        responses.GET,
+        "https://doi.org/10.1234/citing.paper2",
+        json={"title": "Second paper citing our dataset", "container-title": "Test Science"},
+    )
+
+    discoverer = CrossRefDiscoverer()
+    citations = discoverer.discover(ItemRef(ref_type="doi", ref_value="10.1234/test.dataset"))
+
+    assert [c.citation_doi for c in citations] == ["10.1234/citing.paper1", "10.1234/citing.paper2"]
+    assert citations[0].citation_title == "First paper citing our dataset"
+    assert citations[0].citation_authors == "John Smith"
+    assert citations[0].citation_year == 2024
+    assert citations[0].citation_journal == "Journal of Test Research"
+    assert citations[1].citation_title == "Second paper citing our dataset"
+    assert citations[1].citation_journal == "Test Science"
+    assert not any("doi.org/10.1234/citing.paper1" in call.request.url for call in responses.calls)
+
+
+@pytest.mark.ai_generated
+@responses.activate
+def test_crossref_doi_metadata_cache(tmp_path: Path) -> None:
+    """Test DOI metadata is persisted and reused by later discoverers."""
+    from citations_collector.discovery.utils import DOIMetadataCache
+
+    responses.add(
+        responses.GET,
+        "https://doi.org/10.1234/citing.paper1",
+        json={"title": "Cached paper", "published": {"date-parts": [[2024]]}},
+        status=200,
+    )
+    cache_file = tmp_path / "cache" / "doi.sqlite"
+
+    first = CrossRefDiscoverer(cache=DOIMetadataCache(cache_file))
+    assert first._fetch_doi_metadata("10.1234/citing.paper1")["title"] == "Cached paper"
+
+    second = CrossRefDiscoverer(cache=DOIMetadataCache(cache_file))
+    metadata = second._fetch_doi_metadata("10.1234/CITING.PAPER1")
+    assert metadata["title"] == "Cached paper"
+    assert metadata["year"] == 2024
+    assert len(responses.calls) == 1
+
+    # Expired entries are refetched
+    expired = CrossRefDiscoverer(cache=DOIMetadataCache(cache_file, ttl_days=0))
+    expired._fetch_doi_metadata("10.1234/citing.paper1")
+    assert len(responses.calls) == 2
+
+
+@pytest.mark.ai_generated
+@responses.activate
+def test_crossref_doi_metadata_cache_locked(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a locked or broken cache database degrades to misses, not lost citations."""
+    import sqlite3
+
+    from citations_collector.discovery.utils import DOIMetadataCache
+
+    monkeypatch.setattr(DOIMetadataCache, "BUSY_TIMEOUT", 0.05)
+    responses.add(
+        responses.GET,
+        "https://doi.org/10.1234/citing.paper1",
+        json={"title": "Fetched anyway"},
+        status=200,
+    )
+    cache_file = tmp_path / "doi.sqlite"
+    cache = DOIMetadataCache(cache_file)
+
+    # Another process (e.g. a parallel update_examples job) holds the write lock
+    other = sqlite3.connect(cache_file, isolation_level=None)
+    other.execute("BEGIN EXCLUSIVE")
+    try:
+        discoverer = CrossRefDiscoverer(cache=cache)
+        metadata = discoverer._fetch_doi_metadata("10.1234/citing.paper1")
+        assert metadata["title"] == "Fetched anyway"
+    finally:
+        other.execute("ROLLBACK")
+        other.close()
+
+    # The write was skipped, so the DOI is still a miss
+    assert cache.get("10.1234/citing.paper1") is None
+
+    # A connection that fails outright is a miss and a skipped write too
+    cache._conn.close()
+    assert cache.get("10.1234/citing.paper1") is None
+    cache.set("10.1234/citing.paper1", {"title": "x"})
+
+
+@pytest.mark.ai_generated
+def test_crossref_metadata_pool_shared_across_calls(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test concurrent discover() calls share METADATA_WORKERS lookup threads, in order."""
+    discoverer = CrossRefDiscoverer()
+    lock = threading.Lock()
+    active = peak = 0
+
+    def fetch(doi: str) -> dict[str, str | int | None]:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return {"title": doi}
+
+    monkeypatch.setattr(discoverer, "_fetch_works_batch", lambda dois: {})
+    monkeypatch.setattr(discoverer, "_fetch_doi_metadata", fetch)
+    batches = [[f"10.1234/{n}.{i}" for i in range(12)] for n in range(4)]
+
+    with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+        results = list(executor.map(discoverer._fetch_doi_metadata_many, batches))
+
+    assert [[m["title"] for m in result] for result in results] == batches
+    assert peak <= CrossRefDiscoverer.METADATA_WORKERS
+
+
 @pytest.mark.ai_generated
 @responses.activate
 def test_opencitations_discovery(responses_dir: Path) -> None:
@@ -326,3 +510,155 @@ def test_datacite_non_doi_ref() -> None:
     # Should return empty list and log warning
     citations = discoverer.discover(item_ref)
     assert citations == []
+
+
+@pytest.mark.ai_generated
+@responses.activate
+def test_opencitations_retries_rate_limited(responses_dir: Path) -> None:
+    """Test OpenCitations retries a 429 response after Retry-After."""
+    with open(responses_dir / "opencitations_success.json") as f:
+        mock_data = json.load(f)
+
+    url = "https://opencitations.net/index/coci/api/v1/citations/10.1234/test.dataset"
+    responses.add(responses.GET, url, status=429, headers={"Retry-After": "0"})
+    responses.add(responses.GET, url, json=mock_data, status=200)
+    responses.add(
+        responses.GET,
+        "https://doi.org/10.1234/citing.paper3",
+        json={"title": "Third paper citing our dataset"},
+        status=200,
+    )
+
+    discoverer = OpenCitationsDiscoverer()
+    citations = discoverer.discover(ItemRef(ref_type="doi", ref_value="10.1234/test.dataset"))
+
+    assert len(citations) == 1
+    assert citations[0].citation_doi == "10.1234/citing.paper3"
+
+
+@pytest.mark.ai_generated
+def test_rate_limited_session_does_not_retry_timeouts() -> None:
+    """Test a read timeout raises Timeout after one attempt instead of being retried."""
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(8)
+    accepted: list[socket.socket] = []
+
+    def accept() -> None:
+        # Accept connections but never answer
+        while True:
+            try:
+                accepted.append(server.accept()[0])
+            except OSError:
+                return
+
+    thread = threading.Thread(target=accept, daemon=True)
+    thread.start()
+    try:
+        discoverer = OpenCitationsDiscoverer()
+        with pytest.raises(requests.Timeout):
+            discoverer.session.get(f"http://127.0.0.1:{server.getsockname()[1]}/", timeout=0.2)
+    finally:
+        server.close()
+        thread.join(timeout=1)
+        for conn in accepted:
+            conn.close()
+
+    assert len(accepted) == 1
+
+
+@pytest.mark.ai_generated
+def test_rate_limiter_spacing() -> None:
+    """Test RateLimiter allows a burst, then spaces requests at the given rate."""
+    from citations_collector.discovery.utils import RateLimiter
+
+    limiter = RateLimiter(rate=50.0, burst=2)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+    elapsed = time.monotonic() - start
+
+    # Two requests pass immediately, the remaining four wait 20ms each
+    assert 0.07 <= elapsed < 0.5
+
+
+@pytest.mark.ai_generated
+@responses.activate
+def test_rate_limiter_follows_advertised_limit() -> None:
+    """Test CrossRef's X-Rate-Limit headers slow the limiter but never speed it up."""
+    from citations_collector.discovery.utils import advertised_rate
+
+    assert advertised_rate({"X-Rate-Limit-Limit": "50", "X-Rate-Limit-Interval": "1s"}) == 50
+    assert advertised_rate({"X-Rate-Limit-Limit": "300", "X-Rate-Limit-Interval": "5m"}) == 1
+    assert advertised_rate({"X-Rate-Limit-Limit": "50"}) is None
+    assert advertised_rate({"X-Rate-Limit-Limit": "x", "X-Rate-Limit-Interval": "1s"}) is None
+
+    responses.add(
+        responses.GET,
+        "https://doi.org/10.1234/slow",
+        json={"title": "Slow"},
+        headers={"X-Rate-Limit-Limit": "5", "X-Rate-Limit-Interval": "1s"},
+    )
+    responses.add(
+        responses.GET,
+        "https://doi.org/10.1234/fast",
+        json={"title": "Fast"},
+        headers={"X-Rate-Limit-Limit": "1000", "X-Rate-Limit-Interval": "1s"},
+    )
+    discoverer = CrossRefDiscoverer()
+    discoverer._fetch_doi_metadata("10.1234/slow")
+    limiter = host_rate_limiter("doi.org", CrossRefDiscoverer.RATE_LIMIT)
+    assert limiter.rate == 5
+    discoverer._fetch_doi_metadata("10.1234/fast")
+    assert limiter.rate == CrossRefDiscoverer.RATE_LIMIT
+
+
+@pytest.mark.ai_generated
+@responses.activate
+def test_rate_limiters_are_shared_per_host() -> None:
+    """Test sessions share one limiter per host, at the lowest configured rate."""
+    responses.add(responses.GET, "https://doi.org/10.1234/a", json={"title": "A"})
+    responses.add(responses.GET, "https://api.crossref.org/works/10.1234/a", json={})
+
+    first, second = CrossRefDiscoverer(), CrossRefDiscoverer()
+    first.session.get("https://doi.org/10.1234/a")
+    second.session.get("https://doi.org/10.1234/a")
+    doi_org = host_rate_limiter("doi.org", CrossRefDiscoverer.RATE_LIMIT)
+    assert doi_org.rate == CrossRefDiscoverer.RATE_LIMIT
+
+    # Another discoverer with a lower limit for the same host lowers it for all
+    OpenCitationsDiscoverer().session.get("https://doi.org/10.1234/a")
+    assert host_rate_limiter("doi.org", CrossRefDiscoverer.RATE_LIMIT) is doi_org
+    assert doi_org.rate == doi_org.max_rate == OpenCitationsDiscoverer.RATE_LIMIT
+
+    # Other hosts keep their own budget
+    first.session.get("https://api.crossref.org/works/10.1234/a")
+    crossref_api = host_rate_limiter("api.crossref.org", CrossRefDiscoverer.RATE_LIMIT)
+    assert crossref_api is not doi_org
+    assert crossref_api.rate == CrossRefDiscoverer.RATE_LIMIT
+
+
+@pytest.mark.ai_generated
+def test_strip_doi_prefix() -> None:
+    """Test resolver URLs and doi: prefixes are stripped only at the start."""
+    from citations_collector.discovery.utils import strip_doi_prefix
+
+    assert strip_doi_prefix("https://doi.org/10.1234/abc") == "10.1234/abc"
+    assert strip_doi_prefix("http://dx.doi.org/10.1234/abc") == "10.1234/abc"
+    assert strip_doi_prefix("doi:10.1234/abc") == "10.1234/abc"
+    assert strip_doi_prefix("10.1234/abc") == "10.1234/abc"
+    assert strip_doi_prefix("10.1234/doi:abc") == "10.1234/doi:abc"
+
+
+@pytest.mark.ai_generated
+@responses.activate
+def test_parse_json_errors_are_request_exceptions() -> None:
+    """Test parse_json decodes bodies and reports bad JSON as a RequestException."""
+    from citations_collector.discovery.utils import parse_json
+
+    responses.add(responses.GET, "https://example.org/ok", json={"a": [1, 2.5, None, "é"]})
+    responses.add(responses.GET, "https://example.org/bad", body="not json")
+
+    assert parse_json(requests.get("https://example.org/ok")) == {"a": [1, 2.5, None, "é"]}
+    with pytest.raises(requests.RequestException):
+        parse_json(requests.get("https://example.org/bad"))
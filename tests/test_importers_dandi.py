@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import time
+
 import pytest
 import responses
 
@@ -323,6 +325,30 @@ def test_dandi_importer_api_error() -> None:
     assert len(collection.items) == 0
 
 
+@pytest.mark.ai_generated
+def test_dandi_importer_map_ordered_is_bounded() -> None:
+    """Concurrent conversion yields in input order and stops consuming on early exit."""
+    consumed: list[int] = []
+
+    def inputs():  # type: ignore[no-untyped-def]
+        for i in range(100):
+            consumed.append(i)
+            yield i
+
+    def slow_square(x: int) -> int:
+        # Earlier inputs take longer, so results complete out of input order
+        time.sleep(max(0, 10 - x) * 0.001)
+        return x * x
+
+    results = DANDIImporter._map_ordered(slow_square, inputs(), concurrency=4)
+    first = [next(results) for _ in range(5)]
+    results.close()
+
+    assert first == [0, 1, 4, 9, 16]
+    # Only a bounded window beyond what was consumed is ever submitted
+    assert len(consumed) <= 5 + 4
+
+
 @pytest.mark.ai_generated
 @responses.activate
 def test_dandi_importer_custom_api_url() -> None:
@@ -0,0 +1,255 @@
+"""Tests for helper scripts in scripts/."""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import shutil
+import sys
+import types
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+
+XML_DECLARED_HTML = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE html>
+<html xmlns="http://www.w3.org/1999/xhtml"><body>
+<p>Recordings were obtained from the DANDI Archive (dandiset 000003) and reanalyzed here.</p>
+</body></html>
+"""
+
+
+def _load_script(name: str) -> Any:
+    """Import a script from scripts/ as a module."""
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / f"{name}.py")
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.ai_generated
+def test_html_with_xml_declaration(tmp_path: Path) -> None:
+    """Test DANDI mentions are extracted from XML-declared (XHTML) documents."""
+    analyze = _load_script("analyze_citation_pdfs")
+    html_file = tmp_path / "paper.html"
+    html_file.write_text(XML_DECLARED_HTML, encoding="utf-8")
+
+    mentions = analyze.extract_dandi_mentions_html(html_file)
+
+    assert len(mentions) == 1
+    assert "DANDI Archive (dandiset 000003)" in mentions[0]
+
+
+@pytest.mark.ai_generated
+def test_html_to_text_falls_back_when_lxml_rejects(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the stdlib parser is used when lxml refuses str with an encoding declaration."""
+    analyze = _load_script("analyze_citation_pdfs")
+
+    def fromstring(content: str) -> None:
+        # lxml's documented behaviour for such str input
+        raise ValueError(
+            "Unicode strings with encoding declaration are not supported. "
+            "Please use bytes input or XML fragments without declaration."
+        )
+
+    lxml = types.ModuleType("lxml")
+    lxml_html = types.ModuleType("lxml.html")
+    lxml_html.fromstring = fromstring  # type: ignore[attr-defined]
+    lxml.html = lxml_html  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "selectolax", None)
+    monkeypatch.setitem(sys.modules, "lxml", lxml)
+    monkeypatch.setitem(sys.modules, "lxml.html", lxml_html)
+
+    text = analyze._html_to_text(XML_DECLARED_HTML)
+
+    assert "DANDI Archive (dandiset 000003)" in text
+
+
+@pytest.mark.ai_generated
+@pytest.mark.parametrize("engine", ["hyperscan", "regex"])
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        # "preprocessed data" is both a derivation and a data-use cue
+        ("We preprocessed data from DANDI recordings.", ("Uses/UsesDataFrom", "IsDerivedFrom")),
+        ("Models were evaluated on DANDI recordings.", ("CitesAsEvidence", "Reviews")),
+        ("Recordings from dandi:000003 and dandi:000004.", ("Compiles",)),
+        # The repeated-"dandi" check is case-sensitive
+        ("Recordings from dandi:000003 and DANDI:000004.", ("Cites (generic)",)),
+        (
+            "The dataset is available in the DANDI Archive.",
+            ("IsDocumentedBy", "References/CitesForInformation"),
+        ),
+        (
+            "We downloaded the data from DANDI, pooled them and benchmarked spike-sorted units.",
+            ("Uses/UsesDataFrom", "CitesAsEvidence", "Compiles", "IsDerivedFrom"),
+        ),
+        ("A survey and assessment of DANDI testing practices.", ("CitesAsEvidence", "Reviews")),
+        ("Données analysées: we analyzed data from DANDI.", ("Uses/UsesDataFrom",)),
+        ("Data were obtained from DANDI.", ("Cites (generic)",)),
+    ],
+)
+def test_classify_relationship_from_text(
+    monkeypatch: pytest.MonkeyPatch, engine: str, text: str, expected: tuple[str, ...]
+) -> None:
+    """Test the Hyperscan and fused-regex classifiers report the same labels."""
+    analyze = _load_script("analyze_citation_pdfs")
+    if engine == "hyperscan":
+        if analyze._HYPERSCAN_DB is None:
+            pytest.skip("hyperscan is not installed")
+    else:
+        monkeypatch.setattr(analyze, "_HYPERSCAN_DB", None)
+
+    assert analyze.classify_relationship_from_text(text) == expected
+
+
+@pytest.mark.ai_generated
+def test_analyze_rejects_non_positive_jobs(tmp_path: Path) -> None:
+    """Test --jobs below 1 is a usage error rather than a pool traceback."""
+    from click.testing import CliRunner
+
+    analyze = _load_script("analyze_citation_pdfs")
+    (tmp_path / "paper.html").write_text(XML_DECLARED_HTML, encoding="utf-8")
+
+    result = CliRunner().invoke(analyze.main, [str(tmp_path), "--jobs", "-1"])
+
+    assert result.exit_code == 2
+    assert "--jobs" in result.output
+
+
+@pytest.mark.ai_generated
+@pytest.mark.parametrize(
+    "content",
+    [
+        "\ufeffname: BOM\nitems: []\n",
+        "{name: Flow, items: []}\n",
+        '{"items": [], "name": "JSON style"}\n',
+        "# comment\n---\nname: After header\nitems: []\n",
+    ],
+)
+def test_collection_sniff_accepts_valid_collections(tmp_path: Path, content: str) -> None:
+    """Test the sniff never rejects a file that loads as a collection."""
+    from citations_collector.persistence import yaml_io
+
+    update_examples = _load_script("update_examples")
+    yaml_file = tmp_path / "collection.yaml"
+    yaml_file.write_text(content, encoding="utf-8")
+
+    yaml_io.load_collection(yaml_file)
+    assert update_examples._looks_like_collection(yaml_file)
+
+
+@pytest.mark.ai_generated
+def test_update_examples_skips_unreadable_and_non_collections(tmp_path: Path) -> None:
+    """Test unreadable and non-collection YAML files are skipped, not fatal."""
+    from click.testing import CliRunner
+
+    update_examples = _load_script("update_examples")
+    (tmp_path / "unreadable.yaml").mkdir()  # read_bytes() raises IsADirectoryError
+    (tmp_path / "workflow.yaml").write_text("on: push\njobs: {}\n")
+
+    result = CliRunner().invoke(update_examples.main, ["--examples-dir", str(tmp_path)])
+
+    assert result.exit_code == 1
+    assert result.exception is None or isinstance(result.exception, SystemExit)
+    assert "Skipping non-collection file: unreadable.yaml" in result.output
+    assert "Skipping non-collection file: workflow.yaml" in result.output
+
+
+@pytest.mark.ai_generated
+@pytest.mark.parametrize(("jobs", "progress"), [("1", True), ("2", False)])
+def test_update_examples_progress_only_single_job(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    collections_dir: Path,
+    jobs: str,
+    progress: bool,
+) -> None:
+    """Test parallel updates disable the per-collection progress bar."""
+    from click.testing import CliRunner
+
+    from citations_collector.core import CitationCollector
+
+    update_examples = _load_script("update_examples")
+    for name in ("a.yaml", "b.yaml"):
+        shutil.copy(collections_dir / "simple.yaml", tmp_path / name)
+    calls: list[bool] = []
+
+    def discover_all(self: CitationCollector, **kwargs: Any) -> None:
+        calls.append(kwargs["progress"])
+
+    monkeypatch.setattr(CitationCollector, "discover_all", discover_all)
+
+    result = CliRunner().invoke(
+        update_examples.main, ["--examples-dir", str(tmp_path), "--jobs", jobs]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert calls == [progress, progress]
+
+
+@pytest.mark.ai_generated
+def test_update_examples_skip_unchanged(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, collections_dir: Path, tsv_dir: Path
+) -> None:
+    """Test --skip-unchanged skips only collections whose YAML and TSV are untouched."""
+    from click.testing import CliRunner
+
+    from citations_collector.core import CitationCollector
+
+    update_examples = _load_script("update_examples")
+    yaml_path = tmp_path / "simple.yaml"
+    tsv_path = tmp_path / "simple-citations.tsv"
+    shutil.copy(collections_dir / "simple.yaml", yaml_path)
+    shutil.copy(tsv_dir / "simple.tsv", tsv_path)
+    discovered: list[str] = []
+
+    def discover_all(self: CitationCollector, **kwargs: Any) -> None:
+        discovered.append(self.collection.name)
+
+    monkeypatch.setattr(CitationCollector, "discover_all", discover_all)
+
+    def run() -> str:
+        result = CliRunner().invoke(
+            update_examples.main, ["--examples-dir", str(tmp_path), "--skip-unchanged"]
+        )
+        assert result.exit_code == 0, result.output
+        return result.output
+
+    # First run has no manifest yet
+    output = run()
+    assert len(discovered) == 1
+    assert "All collections updated successfully!" in output
+
+    # Rerun is skipped, and the summary still counts its existing citations
+    output = run()
+    assert len(discovered) == 1
+    assert "Collections updated: 0/0" in output
+    assert "Collections skipped (unchanged): 1" in output
+    assert "Total citations: 1" in output
+    assert "All collections up to date (0 updated, 1 unchanged)" in output
+    assert "updated successfully" not in output
+
+    # Touching the YAML so it is newer than the TSV reruns discovery
+    tsv_mtime = tsv_path.stat().st_mtime
+    os.utime(yaml_path, (tsv_mtime + 10, tsv_mtime + 10))
+    run()
+    assert len(discovered) == 2
+    run()
+    assert len(discovered) == 2
+
+    # So does editing the YAML, even if its mtime is older than the TSV
+    yaml_path.write_text(yaml_path.read_text() + "# edited\n")
+    tsv_mtime = tsv_path.stat().st_mtime
+    os.utime(yaml_path, (tsv_mtime - 10, tsv_mtime - 10))
+    run()
+    assert len(discovered) == 3
+
+    # And deleting the TSV
+    tsv_path.unlink()
+    run()
+    assert len(discovered) == 4